@@ -3,6 +3,7 @@ import os
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from strawberry.fastapi import GraphQLRouter
 
 from iris_vector_graph import IRISGraphEngine, gql
@@ -18,6 +19,12 @@ from api.gql.loaders import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    _DefaultResponse = JSONResponse
+
 
 def get_engine():
     port = os.getenv("IRIS_PORT", "1972")
@@ -46,7 +53,7 @@ def create_app(engine: "IRISGraphEngine | None" = None) -> FastAPI:
         except Exception:
             engine = None
 
-    app = FastAPI(title="IRIS Vector Graph API")
+    app = FastAPI(title="IRIS Vector Graph API", default_response_class=_DefaultResponse)
 
     conn = engine.conn if engine is not None else None
 
@@ -4,10 +4,24 @@ import logging
 
 from iris_vector_graph.schema import GraphSchema
 from iris_vector_graph.cypher.translator import _table
+from iris_vector_graph.utils import _json_loads
 
 logger = logging.getLogger(__name__)
 
 
+def _vector_csv(values) -> str:
+    """Comma-joined TO_VECTOR literal for a list or 1-D array of numbers.
+
+    float64 ndarrays go through tolist(): str() of the resulting Python floats
+    is identical to str() of np.float64 but skips creating a numpy scalar per
+    element. Other dtypes keep per-element str() so the literal text (and the
+    value IRIS parses from it) is unchanged.
+    """
+    if getattr(values, "dtype", None) == "float64":
+        values = values.tolist()
+    return ",".join(map(str, values))
+
+
 class EmbeddingsMixin:
     """Embedding and vector storage mixin for IRISGraphEngine.
     
@@ -76,6 +90,45 @@ class EmbeddingsMixin:
         )
 
 
+    _QUERY_EMBEDDING_CACHE_SIZE = 10_000
+
+    def _embed_query(self, text: str) -> List[float]:
+        """embed_text() for search queries, memoised in a bounded per-engine LRU.
+
+        Search traffic repeats a small set of query strings and the encoder is
+        the dominant cost of a semantic search; ingest paths keep calling
+        embed_text() directly so one-off node texts never enter the cache.
+
+        The stripped text is both the cache key and what gets embedded. The
+        cache is dropped whenever ``embedder`` or ``embedding_config`` changes,
+        and is guarded by a lock because one engine serves many threads; the
+        encoder itself runs outside the lock.
+        """
+        key = text.strip()
+        cache = self._query_embedding_cache
+        embedder, config = self.embedder, self.embedding_config
+        with self._query_embedding_lock:
+            source = self._query_embedding_source
+            if source is None or source[0] is not embedder or source[1] != config:
+                cache.clear()
+                self._query_embedding_source = (embedder, config)
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return list(cached)
+
+        vec = self.embed_text(key)
+
+        with self._query_embedding_lock:
+            # Only cache if the embedder was not swapped (or lazily loaded)
+            # while this call was encoding.
+            if self.embedder is embedder and self.embedding_config == config:
+                cache[key] = tuple(vec)
+                if len(cache) > self._QUERY_EMBEDDING_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return list(vec)
+
+
     def _get_embedding_dimension(self) -> int:
         """
         Get the vector embedding dimension, either from initialization or auto-detection.
@@ -193,7 +246,7 @@ class EmbeddingsMixin:
             )
 
         cursor = self.conn.cursor()
-        emb_str = ",".join(str(x) for x in embedding)
+        emb_str = _vector_csv(embedding)
         meta_json = json.dumps(metadata) if metadata else None
 
         try:
@@ -225,6 +278,9 @@ class EmbeddingsMixin:
                 f"Embedding dimension auto-detection failed. Inferred dimension {dim} from input."
             )
 
+        # Last item wins for a repeated node_id, as with the old per-item
+        # DELETE + INSERT; the batched INSERT below would otherwise hit the PK.
+        rows: Dict[str, tuple] = {}
         for item in items:
             node_id = item["node_id"]
             embedding = item["embedding"]
@@ -232,29 +288,33 @@ class EmbeddingsMixin:
                 raise ValueError(
                     f"Embedding dimension mismatch: expected {dim}, got {len(embedding)}"
                 )
-            self._assert_node_exists(node_id)
+            metadata = item.get("metadata")
+            rows[node_id] = (
+                node_id,
+                _vector_csv(embedding),
+                json.dumps(metadata) if metadata else None,
+            )
 
+        node_ids = list(rows)
+        self._assert_nodes_exist(node_ids)
+
+        table = _table("kg_NodeEmbeddings")
         cursor = self.conn.cursor()
         cursor.execute("START TRANSACTION")
         try:
-            for item in items:
-                node_id = item["node_id"]
-                embedding = item["embedding"]
-                metadata = item.get("metadata")
-
-                emb_str = ",".join(str(x) for x in embedding)
-                meta_json = json.dumps(metadata) if metadata else None
-
+            for i in range(0, len(node_ids), 499):
+                chunk = node_ids[i : i + 499]
                 try:
                     cursor.execute(
-                        f"DELETE FROM {_table('kg_NodeEmbeddings')} WHERE id = ?", [node_id]
+                        f"DELETE FROM {table} WHERE id IN ({','.join(['?'] * len(chunk))})",
+                        chunk,
                     )
                 except Exception:
                     pass
-                cursor.execute(
-            f"INSERT INTO {_table('kg_NodeEmbeddings')} (id, emb, metadata) VALUES (?, TO_VECTOR('{emb_str}', {_dtype}), ?)",
-                    [node_id, meta_json],
-                )
+            cursor.executemany(
+                f"INSERT INTO {table} (id, emb, metadata) VALUES (?, TO_VECTOR(?, {_dtype}), ?)",
+                list(rows.values()),
+            )
             cursor.execute("COMMIT")
             return True
         except Exception:
@@ -383,7 +443,7 @@ class EmbeddingsMixin:
                     if emb is None:
                         errors += 1
                         continue
-                    emb_str = ",".join(str(x) for x in emb)
+                    emb_str = _vector_csv(emb)
                     insert_params.append((node_id, emb_str))
 
                 if insert_params:
@@ -543,7 +603,7 @@ class EmbeddingsMixin:
                     if emb is None:
                         errors += 1
                         continue
-                    emb_str = ",".join(str(x) for x in emb)
+                    emb_str = _vector_csv(emb)
                     insert_params.append((s, p, o_id, emb_str))
 
                 if insert_params:
@@ -617,7 +677,7 @@ class EmbeddingsMixin:
 
         node_id, emb_csv, metadata_json = row
         embedding = [float(x) for x in emb_csv.split(",")] if emb_csv else []
-        metadata = json.loads(metadata_json) if metadata_json else None
+        metadata = _json_loads(metadata_json) if metadata_json else None
 
         result = {"id": node_id, "embedding": embedding}
         if metadata:
@@ -649,7 +709,7 @@ class EmbeddingsMixin:
         for row in cursor.fetchall():
             node_id, emb_csv, metadata_json = row
             embedding = [float(x) for x in emb_csv.split(",")] if emb_csv else []
-            metadata = json.loads(metadata_json) if metadata_json else None
+            metadata = _json_loads(metadata_json) if metadata_json else None
 
             result = {"id": node_id, "embedding": embedding}
             if metadata:
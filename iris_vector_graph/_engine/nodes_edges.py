@@ -1,13 +1,38 @@
+import functools
 import json
 import logging
+import sys
 from typing import Dict, Any, Optional, List
 
 from iris_vector_graph.schema import GraphSchema
 from iris_vector_graph.cypher.translator import _table
 from iris_vector_graph._validate import NodeIdInput, EdgeInput
+from iris_vector_graph.utils import _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Ids per get_nodes statement. Each id is bound once per UNION ALL leg (three
+# IN lists), so 3 * 166 = 498 keeps the statement within the 499-parameter
+# IN-list limit.
+_GET_NODES_CHUNK = 166
+_STRUCTURAL_KEYS = ("id", "labels")
+
+
+@functools.lru_cache(maxsize=32)
+def _get_nodes_sql(props_tbl: str, labels_tbl: str, nodes_tbl: str, n: int) -> str:
+    """Tagged props/labels/existence UNION ALL for `n` ids (bound three times).
+
+    A get_nodes call only ever needs the full-chunk size and one tail size, so
+    the statement text is built once per (schema, size) instead of per chunk.
+    """
+    placeholders = ",".join(["?"] * n)
+    # Props leg first so the result column types come from rdf_props.
+    return (
+        f"SELECT s, 'P', \"key\", val FROM {props_tbl} WHERE s IN ({placeholders}) "
+        f"UNION ALL SELECT s, 'L', label, NULL FROM {labels_tbl} WHERE s IN ({placeholders}) "
+        f"UNION ALL SELECT node_id, 'N', NULL, NULL FROM {nodes_tbl} WHERE node_id IN ({placeholders})"
+    )
+
 
 class _BulkLoadSession:
     def __init__(self, engine, stats, max_retries):
@@ -140,6 +165,30 @@ class NodesEdgesMixin:
             if hasattr(cursor, 'close'):
                 cursor.close()
 
+    def _assert_nodes_exist(self, node_ids: List[str]) -> None:
+        """Batch form of _assert_node_exists: one IN query per 499 ids."""
+        found = set()
+        cursor = self.conn.cursor()
+        try:
+            for i in range(0, len(node_ids), 499):
+                chunk = node_ids[i : i + 499]
+                cursor.execute(
+                    f"SELECT node_id FROM {_table('nodes')} "
+                    f"WHERE node_id IN ({','.join(['?'] * len(chunk))})",
+                    chunk,
+                )
+                found.update(row[0] for row in cursor.fetchall())
+        except Exception:
+            return
+        finally:
+            if hasattr(cursor, 'close'):
+                cursor.close()
+        missing = [nid for nid in node_ids if nid not in found]
+        if missing:
+            shown = ", ".join(missing[:10])
+            more = f" (+{len(missing) - 10} more)" if len(missing) > 10 else ""
+            raise ValueError(f"Node does not exist: {shown}{more}")
+
 
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -210,85 +259,99 @@ class NodesEdgesMixin:
         ]
 
 
-    def get_nodes(self, node_ids: List[str]) -> List[Dict[str, Any]]:
+    def get_nodes_columnar(self, node_ids: List[str]) -> Dict[str, list]:
         """
-        Retrieve multiple nodes by ID using optimized batch SQL.
+        Retrieve multiple nodes as parallel columns instead of per-node dicts.
 
-        Eliminates N+1 query patterns by fetching all labels and properties
-        for a set of nodes in two efficient queries.
+        Runs the same batched props/labels/existence query as get_nodes, but
+        accumulates labels and properties per id in one pass and returns
+        ``{"id": [...], "labels": [[...], ...], "props": [{...}, ...]}`` in
+        input order, skipping ids that do not exist. JSON-looking property
+        values are decoded in one batch after all rows are read. Unlike
+        get_nodes, SQL errors propagate to the caller.
 
         Args:
             node_ids: List of node identifiers
 
         Returns:
-            List of node dicts with 'id', 'labels', and properties
+            Dict of equal-length 'id', 'labels' and 'props' lists
         """
+        ids: List[str] = []
+        labels: List[List[str]] = []
+        props: List[Dict[str, Any]] = []
         if not node_ids:
-            return []
+            return {"id": ids, "labels": labels, "props": props}
 
-        _IN_CHUNK = 499
+        cursor = self.conn.cursor()
+        tables = (_table("rdf_props"), _table("rdf_labels"), _table("nodes"))
+        seen: set = set()
+        labels_by_id: Dict[str, List[str]] = {}
+        props_by_id: Dict[str, Dict[str, Any]] = {}
+        pending_json = []
+
+        for i in range(0, len(node_ids), _GET_NODES_CHUNK):
+            chunk = node_ids[i : i + _GET_NODES_CHUNK]
+            cursor.execute(_get_nodes_sql(*tables, len(chunk)), chunk * 3)
+            while True:
+                rows = cursor.fetchmany(1024)
+                if not rows:
+                    break
+                for s, tag, key, val in rows:
+                    seen.add(s)
+                    if tag == "L":
+                        # Labels and keys repeat across every node in the batch;
+                        # interning keeps one copy of each instead of one per row.
+                        labels_by_id.setdefault(s, []).append(sys.intern(key))
+                    elif tag == "P":
+                        node_props = props_by_id.setdefault(s, {})
+                        node_props[sys.intern(key)] = val
+                        if val is not None:
+                            sval = str(val)
+                            if (sval[:1] == "{" and sval[-1:] == "}") or (
+                                sval[:1] == "[" and sval[-1:] == "]"
+                            ):
+                                pending_json.append((node_props, key, val))
 
-        try:
-            cursor = self.conn.cursor()
-            node_map = {nid: {"id": nid, "labels": []} for nid in node_ids}
+        for node_props, key, raw in pending_json:
+            try:
+                node_props[key] = _json_loads(raw)
+            except Exception:
+                pass
 
-            for i in range(0, len(node_ids), _IN_CHUNK):
-                chunk = node_ids[i : i + _IN_CHUNK]
-                placeholders = ",".join(["?"] * len(chunk))
+        for nid in node_ids:
+            if nid in seen:
+                ids.append(nid)
+                labels.append(labels_by_id.get(nid, []))
+                props.append(props_by_id.get(nid, {}))
+        return {"id": ids, "labels": labels, "props": props}
 
-                cursor.execute(
-                    f"SELECT s, label FROM {_table('rdf_labels')} WHERE s IN ({placeholders})",
-                    chunk,
-                )
-                for s, label in cursor.fetchall():
-                    if s in node_map:
-                        node_map[s]["labels"].append(label)
 
-                cursor.execute(
-                    f'SELECT s, "key", val FROM {_table("rdf_props")} WHERE s IN ({placeholders})',
-                    chunk,
-                )
-                _STRUCTURAL_KEYS = ("id", "labels")
-                for s, key, val in cursor.fetchall():
-                    if s in node_map:
-                        store_key = f"p_{key}" if key in _STRUCTURAL_KEYS else key
-                        if val is not None:
-                            parsed_val = val
-                            try:
-                                if (
-                                    str(val).startswith("{") and str(val).endswith("}")
-                                ) or (
-                                    str(val).startswith("[") and str(val).endswith("]")
-                                ):
-                                    parsed_val = json.loads(val)
-                            except Exception:
-                                pass
-                            node_map[s][store_key] = parsed_val
-                        else:
-                            node_map[s][store_key] = val
-
-            empty_nids = [
-                nid
-                for nid, data in node_map.items()
-                if not data["labels"] and len(data) <= 2
-            ]
-            if empty_nids:
-                existing_empty: set = set()
-                for i in range(0, len(empty_nids), _IN_CHUNK):
-                    chunk = empty_nids[i : i + _IN_CHUNK]
-                    e_placeholders = ",".join(["?"] * len(chunk))
-                    cursor.execute(
-                        f"SELECT node_id FROM {_table('nodes')} WHERE node_id IN ({e_placeholders})",
-                        chunk,
-                    )
-                    existing_empty.update(row[0] for row in cursor.fetchall())
-                return [
-                    node_map[nid]
-                    for nid in node_ids
-                    if nid in existing_empty or nid not in empty_nids
-                ]
+    def get_nodes(self, node_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieve multiple nodes by ID using optimized batch SQL.
+
+        Eliminates N+1 query patterns by fetching properties, labels and node
+        existence for a set of nodes in one tagged UNION ALL query per chunk
+        (see get_nodes_columnar), then zipping the columns into node dicts.
+
+        Args:
+            node_ids: List of node identifiers
+
+        Returns:
+            List of node dicts with 'id', 'labels', and properties
+        """
+        if not node_ids:
+            return []
 
-            return [node_map[nid] for nid in node_ids if nid in node_map]
+        try:
+            cols = self.get_nodes_columnar(node_ids)
+            nodes = []
+            for nid, node_labels, node_props in zip(cols["id"], cols["labels"], cols["props"]):
+                node = {"id": nid, "labels": node_labels}
+                for key, val in node_props.items():
+                    node[f"p_{key}" if key in _STRUCTURAL_KEYS else key] = val
+                nodes.append(node)
+            return nodes
 
         except Exception as e:
             logger.error(f"Batch get_nodes failed: {str(e)}")
@@ -326,16 +389,16 @@ class NodesEdgesMixin:
         props_raw = row_map.get(props_key)
 
         labels = (
-            json.loads(labels_raw)
+            _json_loads(labels_raw)
             if isinstance(labels_raw, str)
             else (labels_raw or [])
         )
         props_items = (
-            json.loads(props_raw) if isinstance(props_raw, str) else (props_raw or [])
+            _json_loads(props_raw) if isinstance(props_raw, str) else (props_raw or [])
         )
 
         if props_items and isinstance(props_items[0], str):
-            props_items = [json.loads(item) for item in props_items]
+            props_items = [_json_loads(item) for item in props_items]
 
         props = {
             item["key"]: item["value"] for item in props_items if isinstance(item, dict)
@@ -11,6 +11,57 @@ from iris_vector_graph._validate import CypherInput, KHop2Input
 logger = logging.getLogger(__name__)
 
 
+# Precompiled once at import; execute_cypher runs these on every call.
+_APPROX_RE = re.compile(
+    r'\bapprox_count_distinct\s*\(\s*(\w+)\s*\)\s+AS\s+(\w+)',
+    re.IGNORECASE,
+)
+_COUNT_DISTINCT_ALIAS_RE = re.compile(
+    r'SELECT\s+COUNT\s*\(\s*DISTINCT\s+.*?\)\s+AS\s+(\w+)', re.IGNORECASE
+)
+_FETCH_FIRST_RE = re.compile(r"FETCH\s+FIRST\s+(\d+)\s+ROWS\s+ONLY", re.IGNORECASE)
+_SELECT_TOP_RE = re.compile(r"\bSELECT\s+(?:DISTINCT\s+)?TOP\s+(\d+)\b", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+_ID_ONLY_SELECT_RE = re.compile(
+    r'SELECT\s+(?:DISTINCT\s+)?(?:\S+\.node_id|\S+\.id)\s+AS\s+(\w+)', re.IGNORECASE
+)
+_FIRST_ALIAS_RE = re.compile(
+    r'SELECT\s+DISTINCT\s+\S+\s+AS\s+(\w+)|SELECT\s+\S+\s+AS\s+(\w+)', re.IGNORECASE
+)
+
+# k-hop fast-path shapes recognised by _try_khop_fast_path
+_1HOP_COUNT_RE = re.compile(
+    r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
+        \s*-\s*\[\s*:\s*(\w+)\s*\]\s*->\s*\(\s*(\w+)\s*\)
+        \s*RETURN\s+count\s*\(\s*\3\s*\)\s+AS\s+(\w+)\s*$''',
+    re.IGNORECASE | re.VERBOSE,
+)
+_1HOP_IDS_RE = re.compile(
+    r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
+        \s*-\s*\[\s*:\s*(\w+)\s*\]\s*->\s*\(\s*(\w+)\s*\)
+        \s*RETURN\s+\3\.node_id(?:\s+AS\s+(\w+))?\s*$''',
+    re.IGNORECASE | re.VERBOSE,
+)
+_2HOP_COUNT_RE = re.compile(
+    r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
+        \s*-\s*\[\s*:\s*(\w+)\s*\*2\s*\]\s*->\s*\(\s*(\w+)\s*\)
+        \s*RETURN\s+count\s*\(\s*\3\s*\)\s+AS\s+(\w+)\s*$''',
+    re.IGNORECASE | re.VERBOSE,
+)
+_2HOP_IDS_RE = re.compile(
+    r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
+        \s*-\s*\[\s*:\s*(\w+)\s*\*2\s*\]\s*->\s*\(\s*(\w+)\s*\)
+        \s*RETURN\s+\3\.node_id(?:\s+AS\s+(\w+))?(?:\s+LIMIT\s+(\d+))?\s*$''',
+    re.IGNORECASE | re.VERBOSE,
+)
+_KHOP_VAR_RE = re.compile(
+    r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
+        \s*-\s*\[\s*(?::\s*(\w+)\s*)?\*\s*1\s*\.\.\s*([2-5])\s*\]\s*->\s*\(\s*(\w+)\s*\)
+        \s*RETURN\s+\4\.node_id(?:\s+AS\s+(\w+))?(?:\s+LIMIT\s+(\d+))?\s*$''',
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
 # ---------------------------------------------------------------------------
 # GDS → ivg procedure shim map
 # Keys are lowercase gds.* procedure names; values are ivg.* equivalents.
@@ -84,11 +135,6 @@ class QueryMixin:
             Dict containing 'columns', 'rows', and 'metadata'
         """
         CypherInput(cypher_query=cypher_query)
-        import re as _re_ec
-        _APPROX_RE = _re_ec.compile(
-            r'\bapprox_count_distinct\s*\(\s*(\w+)\s*\)\s+AS\s+(\w+)',
-            _re_ec.IGNORECASE,
-        )
         _approx_m = _APPROX_RE.search(cypher_query)
         if _approx_m:
             return self._execute_approx_count_distinct(cypher_query, parameters, _approx_m)
@@ -331,9 +377,8 @@ class QueryMixin:
         if vl0.get("min_hops", 1) > 1 or vl0.get("properties") or vl0.get("return_path_funcs"):
             return self._execute_var_length_cypher(sql_query, parameters)
 
-        import re as _re
         sql_str = sql_query.sql if isinstance(sql_query.sql, str) else (sql_query.sql[0] if sql_query.sql else "")
-        count_match = _re.search(r'SELECT\s+COUNT\s*\(\s*DISTINCT\s+.*?\)\s+AS\s+(\w+)', sql_str, _re.IGNORECASE)
+        count_match = _COUNT_DISTINCT_ALIAS_RE.search(sql_str)
 
         params = sql_query.parameters[0] if sql_query.parameters else []
         source_id = None
@@ -357,11 +402,11 @@ class QueryMixin:
         def _extract_limit(s: str) -> int:
             # IRIS SQL uses FETCH FIRST N ROWS ONLY; the build-106 %qaqpre workaround
             # emits SELECT TOP N instead; fall back to LIMIT N.
-            m = _re.search(r"FETCH\s+FIRST\s+(\d+)\s+ROWS\s+ONLY", s, _re.IGNORECASE)
+            m = _FETCH_FIRST_RE.search(s)
             if not m:
-                m = _re.search(r"\bSELECT\s+(?:DISTINCT\s+)?TOP\s+(\d+)\b", s, _re.IGNORECASE)
+                m = _SELECT_TOP_RE.search(s)
             if not m:
-                m = _re.search(r"\bLIMIT\s+(\d+)", s, _re.IGNORECASE)
+                m = _LIMIT_RE.search(s)
             return int(m.group(1)) if m else 0
 
         max_results = _extract_limit(sql_str) if sql_str else 0
@@ -563,20 +608,19 @@ class QueryMixin:
             )
 
         max_results = 0
-        import re as _re
         sql_str = sql_query.sql if isinstance(sql_query.sql, str) else (sql_query.sql[0] if sql_query.sql else "")
         if sql_query.sql:
             # IRIS SQL uses "FETCH FIRST N ROWS ONLY"; the build-106 %qaqpre workaround
             # emits SELECT TOP N instead; fall back to LIMIT N.
-            m = _re.search(r"FETCH\s+FIRST\s+(\d+)\s+ROWS\s+ONLY", sql_str, _re.IGNORECASE)
+            m = _FETCH_FIRST_RE.search(sql_str)
             if not m:
-                m = _re.search(r"\bSELECT\s+(?:DISTINCT\s+)?TOP\s+(\d+)\b", sql_str, _re.IGNORECASE)
+                m = _SELECT_TOP_RE.search(sql_str)
             if not m:
-                m = _re.search(r"\bLIMIT\s+(\d+)", sql_str, _re.IGNORECASE)
+                m = _LIMIT_RE.search(sql_str)
             if m:
                 max_results = int(m.group(1))
 
-        count_match = _re.search(r'SELECT\s+COUNT\s*\(\s*DISTINCT\s+.*?\)\s+AS\s+(\w+)', sql_str, _re.IGNORECASE)
+        count_match = _COUNT_DISTINCT_ALIAS_RE.search(sql_str)
         if count_match:
             col_name = count_match.group(1)
             try:
@@ -687,15 +731,9 @@ class QueryMixin:
 
         # Fast path: if query only needs node IDs (RETURN DISTINCT b.node_id or RETURN b.node_id),
         # skip get_nodes() entirely — BFS already has the IDs.
-        id_only_match = _re.search(
-            r'SELECT\s+(?:DISTINCT\s+)?(?:\S+\.node_id|\S+\.id)\s+AS\s+(\w+)',
-            sql_str, _re.IGNORECASE
-        )
+        id_only_match = _ID_ONLY_SELECT_RE.search(sql_str)
         # Count path: COUNT(DISTINCT ...) — just return the count
-        count_match = _re.search(
-            r'SELECT\s+COUNT\s*\(\s*DISTINCT\s+.*?\)\s+AS\s+(\w+)',
-            sql_str, _re.IGNORECASE
-        )
+        count_match = _COUNT_DISTINCT_ALIAS_RE.search(sql_str)
 
         if count_match:
             col_name = count_match.group(1)
@@ -709,7 +747,7 @@ class QueryMixin:
         if id_only_match:
             col_name = id_only_match.group(1)
             # Apply LIMIT from SQL if present
-            limit_match = _re.search(r'\bLIMIT\s+(\d+)', sql_str, _re.IGNORECASE)
+            limit_match = _LIMIT_RE.search(sql_str)
             limit = int(limit_match.group(1)) if limit_match else None
             result_ids = target_ids[:limit] if limit else target_ids
             return IVGResult(                columns= [col_name],
@@ -720,7 +758,7 @@ class QueryMixin:
             )
 
         # Full path: caller wants labels/props — fall through to get_nodes()
-        alias_match = _re.search(r'SELECT\s+DISTINCT\s+\S+\s+AS\s+(\w+)|SELECT\s+\S+\s+AS\s+(\w+)', sql_str, _re.IGNORECASE)
+        alias_match = _FIRST_ALIAS_RE.search(sql_str)
         col_name = (alias_match.group(1) or alias_match.group(2)) if alias_match else "b_id"
 
         if not target_ids:
@@ -750,33 +788,6 @@ class QueryMixin:
             metadata= sql_query.query_metadata
         )
     def _try_khop_fast_path(self, cypher_query: str, parameters) -> Optional[Dict[str, Any]]:
-        import re as _re
-
-        _1HOP_COUNT_RE = _re.compile(
-            r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
-                \s*-\s*\[\s*:\s*(\w+)\s*\]\s*->\s*\(\s*(\w+)\s*\)
-                \s*RETURN\s+count\s*\(\s*\3\s*\)\s+AS\s+(\w+)\s*$''',
-            _re.IGNORECASE | _re.VERBOSE,
-        )
-        _1HOP_IDS_RE = _re.compile(
-            r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
-                \s*-\s*\[\s*:\s*(\w+)\s*\]\s*->\s*\(\s*(\w+)\s*\)
-                \s*RETURN\s+\3\.node_id(?:\s+AS\s+(\w+))?\s*$''',
-            _re.IGNORECASE | _re.VERBOSE,
-        )
-        _2HOP_COUNT_RE = _re.compile(
-            r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
-                \s*-\s*\[\s*:\s*(\w+)\s*\*2\s*\]\s*->\s*\(\s*(\w+)\s*\)
-                \s*RETURN\s+count\s*\(\s*\3\s*\)\s+AS\s+(\w+)\s*$''',
-            _re.IGNORECASE | _re.VERBOSE,
-        )
-        _2HOP_IDS_RE = _re.compile(
-            r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
-                \s*-\s*\[\s*:\s*(\w+)\s*\*2\s*\]\s*->\s*\(\s*(\w+)\s*\)
-                \s*RETURN\s+\3\.node_id(?:\s+AS\s+(\w+))?(?:\s+LIMIT\s+(\d+))?\s*$''',
-            _re.IGNORECASE | _re.VERBOSE,
-        )
-
         params = parameters or {}
 
         m = _1HOP_COUNT_RE.match(cypher_query)
@@ -848,12 +859,6 @@ class QueryMixin:
         # Routes to NKGAccelTraversal.KHopNeighbors when ^NKG is populated.
         # Handles: MATCH (n {node_id: $x})-[*1..K]->(m) RETURN m.node_id [AS alias] [LIMIT N]
         #          MATCH (n {node_id: $x})-[:PRED*1..K]->(m) RETURN m.node_id [AS alias] [LIMIT N]
-        _KHOP_VAR_RE = _re.compile(
-            r'''^\s*MATCH\s*\(\s*\w+\s*\{\s*node_id\s*:\s*\$(\w+)\s*\}\s*\)
-                \s*-\s*\[\s*(?::\s*(\w+)\s*)?\*\s*1\s*\.\.\s*([2-5])\s*\]\s*->\s*\(\s*(\w+)\s*\)
-                \s*RETURN\s+\4\.node_id(?:\s+AS\s+(\w+))?(?:\s+LIMIT\s+(\d+))?\s*$''',
-            _re.IGNORECASE | _re.VERBOSE,
-        )
         m = _KHOP_VAR_RE.match(cypher_query)
         if m:
             src_param = m.group(1)
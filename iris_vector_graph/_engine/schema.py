@@ -86,7 +86,11 @@ class SchemaMixin:
         return row is not None and int(row[0]) > 0
 
 
-    def initialize_schema(self, auto_deploy_objectscript: bool = True) -> dict:
+    def initialize_schema(
+        self,
+        auto_deploy_objectscript: bool = True,
+        create_vector_indexes: bool = False,
+    ) -> dict:
         """
         Create the base schema tables in IRIS.
 
@@ -106,6 +110,8 @@ class SchemaMixin:
                 the ObjectScript .cls files from iris_src/ into IRIS.  On failure a
                 warning is logged and the engine falls back to Python/SQL paths.
                 Set to False to skip .cls deployment entirely.
+            create_vector_indexes: When True, also create the HNSW index on
+                ``kg_NodeEmbeddings.emb`` as part of the same bootstrap.
         """
         from iris_vector_graph.utils import _split_sql_statements
 
@@ -175,6 +181,9 @@ class SchemaMixin:
 
         # 3. Ensure indexes and run schema migrations (e.g. column size upgrades)
         GraphSchema.ensure_indexes(cursor)
+        vector_index_status = (
+            GraphSchema.ensure_vector_indexes(cursor, dim) if create_vector_indexes else {}
+        )
 
         # 4. Check for dimension mismatch on existing tables; fix untyped vector column
         try:
@@ -376,6 +385,12 @@ class SchemaMixin:
                 "Run docker cp iris_src/src <container>:/tmp/src && docker exec <container> iris session IRIS "
                 "-U USER 'Do $system.OBJ.LoadDir(\"/tmp/src\",\"ck\",,1)' to deploy."
             )
+        for index_name, ok in vector_index_status.items():
+            if not ok:
+                status["warnings"].append(
+                    f"HNSW index {index_name} on kg_NodeEmbeddings.emb could not be created — "
+                    "vector search will fall back to a full scan."
+                )
         if not self.capabilities.kg_built:
             status["warnings"].append(
                 "^KG adjacency index not built — multi-hop BFS unavailable. "
@@ -1,6 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional, List
 import enum
+import re
+import sys
+
+# Identifier/parameter body: str.isalnum() or "_" — exactly what \w matches on
+# str patterns — scanned in C instead of one Python iteration per character.
+_WORD_RE = re.compile(r"\w*")
 
 
 class TokenType(enum.Enum):
@@ -90,6 +96,23 @@ class TokenType(enum.Enum):
     EOF = "EOF"
 
 
+# Upper-cased word -> token kind. Same lookup as TokenType[word] (any member
+# name), but a dict miss is a plain .get() rather than a raised KeyError for
+# every ordinary identifier; keys are interned so hits compare by identity.
+_KEYWORDS = {sys.intern(name): kind for name, kind in TokenType.__members__.items()}
+
+# Punctuation that is always a one-character token (no lookahead needed)
+_SINGLE_CHAR_TOKENS = {
+    t.value: t
+    for t in (
+        TokenType.LPAREN, TokenType.RPAREN, TokenType.LBRACKET, TokenType.RBRACKET,
+        TokenType.LBRACE, TokenType.RBRACE, TokenType.COMMA, TokenType.DOT,
+        TokenType.COLON, TokenType.PIPE, TokenType.STAR, TokenType.SLASH,
+        TokenType.PERCENT, TokenType.CARET,
+    )
+}
+
+
 @dataclass(slots=True, frozen=True)
 class Token:
     kind: TokenType
@@ -110,37 +133,26 @@ class Lexer:
         self.token_index = 0
 
     def _tokenize(self):
-        while self.cursor < len(self.source):
-            char = self.source[self.cursor]
+        src = self.source
+        n = len(src)
+        while self.cursor < n:
+            char = src[self.cursor]
 
             if char.isspace():
                 self._skip_whitespace()
                 continue
 
-            start_pos = self.cursor
-            start_col = self.column
+            # Hot paths first: identifiers/keywords and single-character
+            # punctuation make up most tokens; the match handles the rest.
+            if char.isalpha() or char == "_":
+                self._tokenize_identifier_or_keyword()
+                continue
+            kind = _SINGLE_CHAR_TOKENS.get(char)
+            if kind is not None:
+                self._add_token(kind, char)
+                continue
 
             match char:
-                case "(":
-                    self._add_token(TokenType.LPAREN, char)
-                case ")":
-                    self._add_token(TokenType.RPAREN, char)
-                case "[":
-                    self._add_token(TokenType.LBRACKET, char)
-                case "]":
-                    self._add_token(TokenType.RBRACKET, char)
-                case "{":
-                    self._add_token(TokenType.LBRACE, char)
-                case "}":
-                    self._add_token(TokenType.RBRACE, char)
-                case ",":
-                    self._add_token(TokenType.COMMA, char)
-                case ".":
-                    self._add_token(TokenType.DOT, char)
-                case ":":
-                    self._add_token(TokenType.COLON, char)
-                case "|":
-                    self._add_token(TokenType.PIPE, char)
                 case "+":
                     if self._peek() == "=":
                         self.tokens.append(Token(TokenType.PLUS_EQUAL, "+=", self.cursor, self.line, self.column))
@@ -148,14 +160,6 @@ class Lexer:
                         self.column += 2
                     else:
                         self._add_token(TokenType.PLUS, char)
-                case "*":
-                    self._add_token(TokenType.STAR, char)
-                case "/":
-                    self._add_token(TokenType.SLASH, char)
-                case "%":
-                    self._add_token(TokenType.PERCENT, char)
-                case "^":
-                    self._add_token(TokenType.CARET, char)
                 case "=":
                     if self._peek() == "~":
                         self.cursor += 1
@@ -202,8 +206,6 @@ class Lexer:
                     self._tokenize_parameter()
                 case c if c.isdigit():
                     self._tokenize_number()
-                case c if c.isalpha() or c == "_":
-                    self._tokenize_identifier_or_keyword()
                 case _:
                     raise SyntaxError(
                         f"Unexpected character '{char}' at line {self.line}, col {self.column}"
@@ -224,30 +226,38 @@ class Lexer:
         return None
 
     def _skip_whitespace(self):
-        while self.cursor < len(self.source) and self.source[self.cursor].isspace():
-            if self.source[self.cursor] == "\n":
-                self.line += 1
-                self.column = 1
+        src = self.source
+        n = len(src)
+        i = self.cursor
+        line = self.line
+        column = self.column
+        while i < n and src[i].isspace():
+            if src[i] == "\n":
+                line += 1
+                column = 1
             else:
-                self.column += 1
-            self.cursor += 1
+                column += 1
+            i += 1
+        self.cursor = i
+        self.line = line
+        self.column = column
+
+    def _advance_to(self, end: int):
+        """Move the cursor to `end` on the current line (no newline accounting)."""
+        self.column += end - self.cursor
+        self.cursor = end
 
     def _tokenize_backtick_identifier(self):
         start_pos = self.cursor
         start_col = self.column
-        self.cursor += 1
-        self.column += 1
-        value = ""
-        while self.cursor < len(self.source) and self.source[self.cursor] != '`':
-            value += self.source[self.cursor]
-            self.cursor += 1
-            self.column += 1
-        if self.cursor >= len(self.source):
+        end = self.source.find("`", start_pos + 1)
+        if end == -1:
+            self._advance_to(len(self.source))
             raise SyntaxError(
                 f"Unterminated backtick identifier at line {self.line}, col {start_col}"
             )
-        self.cursor += 1
-        self.column += 1
+        value = self.source[start_pos + 1:end]
+        self._advance_to(end + 1)
         self.tokens.append(
             Token(TokenType.IDENTIFIER, value, start_pos, self.line, start_col)
         )
@@ -255,27 +265,33 @@ class Lexer:
     def _tokenize_string(self, quote: str):
         start_pos = self.cursor
         start_col = self.column
-        self.cursor += 1
-        self.column += 1
-        value = ""
-        while self.cursor < len(self.source) and self.source[self.cursor] != quote:
-            if self.source[self.cursor] == "\\":
-                self.cursor += 1
-                self.column += 1
-                if self.cursor < len(self.source):
-                    value += self.source[self.cursor]
-            else:
-                value += self.source[self.cursor]
-            self.cursor += 1
-            self.column += 1
-
-        if self.cursor >= len(self.source):
+        src = self.source
+        n = len(src)
+        i = start_pos + 1
+        end = src.find(quote, i)
+        if end != -1 and src.find("\\", i, end) == -1:
+            # Common case: no escapes, the literal is a single slice
+            value = src[i:end]
+            i = end
+        else:
+            parts = []
+            while i < n and src[i] != quote:
+                if src[i] == "\\":
+                    i += 1
+                    if i < n:
+                        parts.append(src[i])
+                else:
+                    parts.append(src[i])
+                i += 1
+            value = "".join(parts)
+
+        if i >= n:
+            self._advance_to(i)
             raise SyntaxError(
                 f"Unterminated string starting at line {self.line}, col {start_col}"
             )
 
-        self.cursor += 1
-        self.column += 1
+        self._advance_to(i + 1)
         self.tokens.append(
             Token(TokenType.STRING_LITERAL, value, start_pos, self.line, start_col)
         )
@@ -283,15 +299,9 @@ class Lexer:
     def _tokenize_parameter(self):
         start_pos = self.cursor
         start_col = self.column
-        self.cursor += 1
-        self.column += 1
-        value = ""
-        while self.cursor < len(self.source) and (
-            self.source[self.cursor].isalnum() or self.source[self.cursor] == "_"
-        ):
-            value += self.source[self.cursor]
-            self.cursor += 1
-            self.column += 1
+        end = _WORD_RE.match(self.source, start_pos + 1).end()
+        value = self.source[start_pos + 1:end]
+        self._advance_to(end)
         self.tokens.append(
             Token(TokenType.PARAMETER, value, start_pos, self.line, start_col)
         )
@@ -299,24 +309,21 @@ class Lexer:
     def _tokenize_number(self):
         start_pos = self.cursor
         start_col = self.column
-        value = ""
+        src = self.source
+        n = len(src)
+        i = start_pos
         is_float = False
-        while self.cursor < len(self.source) and (
-            self.source[self.cursor].isdigit() or self.source[self.cursor] == "."
-        ):
-            if self.source[self.cursor] == ".":
+        while i < n and (src[i].isdigit() or src[i] == "."):
+            if src[i] == ".":
                 if is_float:
                     break
                 # Don't consume '.' if it's part of '..' range syntax
-                if (
-                    self.cursor + 1 < len(self.source)
-                    and self.source[self.cursor + 1] == "."
-                ):
+                if i + 1 < n and src[i + 1] == ".":
                     break
                 is_float = True
-            value += self.source[self.cursor]
-            self.cursor += 1
-            self.column += 1
+            i += 1
+        value = src[start_pos:i]
+        self._advance_to(i)
 
         kind = TokenType.FLOAT_LITERAL if is_float else TokenType.INTEGER_LITERAL
         self.tokens.append(Token(kind, value, start_pos, self.line, start_col))
@@ -324,67 +331,56 @@ class Lexer:
     def _tokenize_identifier_or_keyword(self):
         start_pos = self.cursor
         start_col = self.column
-        value = ""
-        while self.cursor < len(self.source) and (
-            self.source[self.cursor].isalnum() or self.source[self.cursor] == "_"
-        ):
-            value += self.source[self.cursor]
-            self.cursor += 1
-            self.column += 1
+        end = _WORD_RE.match(self.source, start_pos).end()
+        value = self.source[start_pos:end]
+        self._advance_to(end)
 
         upper_value = value.upper()
-        try:
-            # Check for STARTS WITH
-            if upper_value == "STARTS" and self._peek_keyword("WITH"):
-                self.tokens.append(
-                    Token(TokenType.STARTS, value, start_pos, self.line, start_col)
-                )
-                self._consume_keyword("WITH", TokenType.WITH_KW)
-                return
-
-            # Check for ENDS WITH
-            if upper_value == "ENDS" and self._peek_keyword("WITH"):
-                self.tokens.append(
-                    Token(TokenType.ENDS, value, start_pos, self.line, start_col)
-                )
-                self._consume_keyword("WITH", TokenType.WITH_KW)
-                return
-
-            kind = TokenType[upper_value]
-            self.tokens.append(Token(kind, value, start_pos, self.line, start_col))
-        except KeyError:
+        # Check for STARTS WITH
+        if upper_value == "STARTS" and self._peek_keyword("WITH"):
             self.tokens.append(
-                Token(TokenType.IDENTIFIER, value, start_pos, self.line, start_col)
+                Token(TokenType.STARTS, value, start_pos, self.line, start_col)
             )
+            self._consume_keyword("WITH", TokenType.WITH_KW)
+            return
+
+        # Check for ENDS WITH
+        if upper_value == "ENDS" and self._peek_keyword("WITH"):
+            self.tokens.append(
+                Token(TokenType.ENDS, value, start_pos, self.line, start_col)
+            )
+            self._consume_keyword("WITH", TokenType.WITH_KW)
+            return
+
+        kind = _KEYWORDS.get(upper_value, TokenType.IDENTIFIER)
+        self.tokens.append(Token(kind, value, start_pos, self.line, start_col))
+
+    def _alpha_run_end(self, i: int) -> int:
+        src = self.source
+        n = len(src)
+        while i < n and src[i].isalpha():
+            i += 1
+        return i
 
     def _peek_keyword(self, keyword: str) -> bool:
-        # Simple peek for multi-word keywords
-        current_cursor = self.cursor
+        # Simple peek for multi-word keywords; `keyword` is passed upper-case
+        src = self.source
+        n = len(src)
+        i = self.cursor
 
         # Skip whitespace
-        while (
-            current_cursor < len(self.source) and self.source[current_cursor].isspace()
-        ):
-            current_cursor += 1
-
-        k_val = ""
-        while (
-            current_cursor < len(self.source) and self.source[current_cursor].isalpha()
-        ):
-            k_val += self.source[current_cursor]
-            current_cursor += 1
+        while i < n and src[i].isspace():
+            i += 1
 
-        return k_val.upper() == keyword.upper()
+        return src[i:self._alpha_run_end(i)].upper() == keyword
 
     def _consume_keyword(self, keyword: str, kind: TokenType):
         self._skip_whitespace()
         start_pos = self.cursor
         start_col = self.column
-        value = ""
-        while self.cursor < len(self.source) and self.source[self.cursor].isalpha():
-            value += self.source[self.cursor]
-            self.cursor += 1
-            self.column += 1
+        end = self._alpha_run_end(start_pos)
+        value = self.source[start_pos:end]
+        self._advance_to(end)
         self.tokens.append(Token(kind, value, start_pos, self.line, start_col))
 
     def peek(self) -> Token:
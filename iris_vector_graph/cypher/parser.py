@@ -1023,6 +1023,40 @@ class Parser:
 
         return left
 
+    def _parse_numeric_list_items(self, items: List[Any]) -> bool:
+        """Consume leading ``[-]number`` list elements without the expression chain.
+
+        Embedding literals passed to ivg.vector.search are hundreds of bare
+        numbers; each would otherwise descend the full precedence ladder.
+        Stops before the first element that is not a plain number followed by
+        ``,`` or ``]``. Returns True if the closing ``]`` was consumed.
+        """
+        tokens = self.lexer.tokens
+        i = self.lexer.token_index
+        n = len(tokens)
+        while i < n:
+            neg = tokens[i].kind == TokenType.MINUS
+            j = i + 1 if neg else i
+            if j + 1 >= n:
+                break
+            tok = tokens[j]
+            if tok.kind == TokenType.INTEGER_LITERAL:
+                val = int(tok.value) if tok.value is not None else 0
+            elif tok.kind == TokenType.FLOAT_LITERAL:
+                val = float(tok.value) if tok.value is not None else 0.0
+            else:
+                break
+            sep = tokens[j + 1].kind
+            if sep != TokenType.COMMA and sep != TokenType.RBRACKET:
+                break
+            items.append(ast.Literal(-val if neg else val))
+            i = j + 2
+            if sep == TokenType.RBRACKET:
+                self.lexer.token_index = i
+                return True
+        self.lexer.token_index = i
+        return False
+
     def parse_primary_expression(self) -> Any:
         """Parse atomic expression elements"""
         tok = self.peek()
@@ -1234,8 +1268,9 @@ class Parser:
                         predicate=predicate,
                         projection=projection,
                     )
-                first = self.parse_expression()
-                items.append(first)
+                if self._parse_numeric_list_items(items):
+                    return ast.Literal(items)
+                items.append(self.parse_expression())
                 while self.matches(TokenType.COMMA):
                     items.append(self.parse_expression())
                 self.expect(TokenType.RBRACKET)
@@ -1361,7 +1396,7 @@ class Parser:
         return None
 
 
-@lru_cache(maxsize=256)
+@lru_cache(maxsize=1024)
 def _parse_query_cached(query_str: str) -> ast.CypherQuery:
     """Internal cached parse — returns a pristine AST. Callers must deepcopy before mutating."""
     lexer = Lexer(query_str)
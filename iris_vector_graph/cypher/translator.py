@@ -7,8 +7,10 @@ Supports multi-stage queries via Common Table Expressions (CTEs).
 
 from dataclasses import dataclass, field
 from typing import List, Any, Dict, Optional, Union
+import functools
 import logging
 import json
+import re
 from pydantic import BaseModel, Field
 from . import ast
 from iris_vector_graph.security import (
@@ -24,6 +26,9 @@ logger = logging.getLogger(__name__)
 # Set to "" (empty string) for unqualified table names
 _schema_prefix: str = ""
 
+# Sentinel for input_params lookups: a parameter bound to None is still bound.
+_MISSING = object()
+
 # Procedure CTE aliases (VecSearch, BM25, DegCent, etc.) whose columns must be
 # referenced UNQUALIFIED in SELECT/ORDER BY. IRIS does not register a
 # JSON_TABLE-backed CTE name as a referenceable label, so `DegCent.score`
@@ -34,6 +39,21 @@ _PROC_CTE_ALIASES = frozenset({
     "Leiden", "TriangleCount", "SCC", "KCore",
 })
 
+# Precompiled SQL post-processing patterns (module scope: compiled once, not per translation)
+_PROC_PREFIX_RE = re.compile(r'^(?:Stage\d+|' + '|'.join(sorted(_PROC_CTE_ALIASES)) + r')\.')
+_DEEP_JOIN_SELECT_RE = re.compile(r'(SELECT\s+(?:DISTINCT\s+)?(?:TOP\s+\d+\s+)?)(.*?)(\nFROM\s)', re.DOTALL)
+_AGG_CALL_RE = re.compile(r'\b(AVG|SUM|COUNT|MIN|MAX|STDEV|JSON_ARRAYAGG)\s*\(')
+_SELECT_ALIAS_RE = re.compile(r'(?:^|(?<=,))\s*([^,]+?)\s+AS\s+("?[a-z_][a-z0-9_"]*"?)\s*(?=,|$)', re.DOTALL)
+_ORDER_BY_TAIL_RE = re.compile(r'\nORDER BY .+', re.DOTALL)
+_FETCH_FIRST_LINE_RE = re.compile(r'\nFETCH FIRST (\d+) ROWS ONLY')
+_OFFSET_LINE_RE = re.compile(r'\nOFFSET \d+')
+_FROM_CLAUSE_RE = re.compile(r'\nFROM\s+(.*?)(?:\nWHERE|\nORDER|\nFETCH|\nGROUP|\nHAVING|$)', re.DOTALL)
+_TRAILING_ALIAS_RE = re.compile(r'AS\s+(\w+)\s*$')
+_SQL_TYPES = frozenset({
+    'INTEGER','INT','DOUBLE','FLOAT','REAL','VARCHAR','CHAR','BIGINT','SMALLINT',
+    'DECIMAL','NUMERIC','BOOLEAN','DATE','TIME','TIMESTAMP','VARBINARY','BINARY',
+})
+
 # Allowed map-parameter keys for centrality procedures (Spec 162 FR-029).
 # The procedure-call validator rejects unknown keys to prevent silent typos
 # and reserves keys (e.g. `weighted`) for future Phase 2 extensions.
@@ -354,7 +374,7 @@ def translate_procedure_call(
     """
     _SYSTEM_PROC_PREFIXES = ("db.", "dbms.", "apoc.", "gds.")
     name = proc.procedure_name
-    if any(name.lower().startswith(p) for p in _SYSTEM_PROC_PREFIXES):
+    if name.lower().startswith(_SYSTEM_PROC_PREFIXES):
         context.system_procedure_call = proc
         return
     if name == "ivg.vector.search":
@@ -403,8 +423,9 @@ def _resolve_arg(arg, context: TranslationContext, name: str, expected_type=None
             ]
         return val
     elif isinstance(arg, ast.Variable):
-        if arg.name in context.input_params:
-            return context.input_params[arg.name]
+        val = context.input_params.get(arg.name, _MISSING)
+        if val is not _MISSING:
+            return val
         raise ValueError(f"{name}: parameter '${arg.name}' not found in params")
     raise ValueError(f"{name}: argument must be a literal or parameter")
 
@@ -417,8 +438,9 @@ def _vs_resolve_query_input(query_input_arg, context):
         return raw
     if isinstance(query_input_arg, ast.Variable):
         var_name = query_input_arg.name
-        if var_name in context.input_params:
-            return context.input_params[var_name]
+        val = context.input_params.get(var_name, _MISSING)
+        if val is not _MISSING:
+            return val
         raise ValueError(f"ivg.vector.search: parameter '${var_name}' not found in params")
     raise ValueError(
         "ivg.vector.search: third argument (query_input) must be a literal or parameter"
@@ -430,9 +452,8 @@ def _vs_resolve_limit(limit_arg, context):
         limit_val = limit_arg.value
     elif isinstance(limit_arg, ast.Variable):
         var_name = limit_arg.name
-        if var_name in context.input_params:
-            limit_val = context.input_params[var_name]
-        else:
+        limit_val = context.input_params.get(var_name, _MISSING)
+        if limit_val is _MISSING:
             raise ValueError(f"ivg.vector.search: parameter '${var_name}' not found in params")
     else:
         raise ValueError(
@@ -469,6 +490,25 @@ def _vs_build_similarity(query_input, vector_fn, label, options, emb_table):
     )
 
 
+@functools.lru_cache(maxsize=16)
+def _vec_cte_template(similarity_expr: str, emb_table: str, labels_tbl: str, exclude_self: bool):
+    """(head, tail) of the VecSearch CTE; the TOP k literal goes between them.
+
+    Only k varies between otherwise identical vector searches, so the stage
+    text is assembled once per (similarity, query kind, schema) combination.
+    """
+    head = "VecSearch AS (\nSELECT TOP "
+    tail = (
+        f" e.id AS node, {similarity_expr} AS score\n"
+        f"FROM {emb_table} e\n"
+        f"JOIN {labels_tbl} lbl ON lbl.s = e.id AND lbl.label = ?\n"
+    )
+    if exclude_self:
+        tail += "WHERE e.id != ?\n"
+    tail += "ORDER BY score DESC\n)"
+    return head, tail
+
+
 def _translate_vector_search(
     proc: ast.CypherProcedureCall, context: TranslationContext
 ) -> None:
@@ -515,18 +555,12 @@ def _translate_vector_search(
         query_input, vector_fn, label, options, emb_table
     )
 
-    cte_sql = (
-        f"SELECT TOP {limit_int} e.id AS node, {similarity_expr} AS score\n"
-        f"FROM {emb_table} e\n"
-        f"JOIN {labels_tbl} lbl ON lbl.s = e.id AND lbl.label = ?\n"
-    )
+    head, tail = _vec_cte_template(similarity_expr, emb_table, labels_tbl, exclude_self)
     if exclude_self:
-        cte_sql += f"WHERE e.id != ?\n"
         ordered_params.append(query_input)
-    cte_sql += f"ORDER BY score DESC"
 
     context.all_stage_params.extend(ordered_params)
-    context.stages.insert(0, f"VecSearch AS (\n{cte_sql}\n)")
+    context.stages.insert(0, f"{head}{limit_int}{tail}")
 
     for item in proc.yield_items:
         context.variable_aliases[item] = "VecSearch"
@@ -1043,31 +1077,24 @@ def _maybe_split_deep_joins(sql: str, params: list, context) -> str:
     join_count = sql.count(" JOIN ")
     if join_count <= JOIN_THRESHOLD:
         return sql
-    import re as _re
     # Capture an optional `TOP n` in the prefix (the FETCH-FIRST-+-JOIN workaround emits
     # SELECT [DISTINCT] TOP n) so it stays attached to the SELECT keyword and is not
     # swept into the column list.
-    select_m = _re.match(r'(SELECT\s+(?:DISTINCT\s+)?(?:TOP\s+\d+\s+)?)(.*?)(\nFROM\s)', sql, _re.DOTALL)
+    select_m = _DEEP_JOIN_SELECT_RE.match(sql)
     if not select_m:
         return sql
     # select_prefix carries any DISTINCT and TOP n; both propagate to the outer wrapper
     # (line below), so the CTE wrap preserves the row cap from the TOP workaround.
     select_prefix = select_m.group(1)
     select_cols = select_m.group(2).strip()
-    has_agg = bool(_re.search(r'\b(AVG|SUM|COUNT|MIN|MAX|STDEV|JSON_ARRAYAGG)\s*\(', select_cols))
+    has_agg = bool(_AGG_CALL_RE.search(select_cols))
     has_group = 'GROUP BY' in sql
     if has_agg and not has_group:
         return sql
     inner_from_onwards = sql[select_m.start(3):]
     inner_sql = f"SELECT {select_cols}{inner_from_onwards}"
-    _SQL_TYPES = frozenset({
-        'INTEGER','INT','DOUBLE','FLOAT','REAL','VARCHAR','CHAR','BIGINT','SMALLINT',
-        'DECIMAL','NUMERIC','BOOLEAN','DATE','TIME','TIMESTAMP','VARBINARY','BINARY',
-    })
-    alias_re = _re.compile(r'\)\s+AS\s+("?[a-z_][a-z0-9_"]*"?)\s*(?:,|\Z)', _re.IGNORECASE | _re.DOTALL)
-    top_as_re = _re.compile(r'(?:^|,)\s*(?:[^,]+?)\s+AS\s+("?[a-z_][a-z0-9_"]*"?)\s*(?=,|$)', _re.IGNORECASE)
     seen = {}
-    for m in _re.finditer(r'(?:^|(?<=,))\s*([^,]+?)\s+AS\s+("?[a-z_][a-z0-9_"]*"?)\s*(?=,|$)', select_cols, _re.DOTALL):
+    for m in _SELECT_ALIAS_RE.finditer(select_cols):
         alias = m.group(2).strip('"')
         if alias.upper() not in _SQL_TYPES:
             seen[alias] = alias
@@ -1075,20 +1102,19 @@ def _maybe_split_deep_joins(sql: str, params: list, context) -> str:
     if not outer_cols:
         return sql
     outer_sql = f"WITH _MR AS (\n{inner_sql}\n)\n{select_prefix}{outer_cols}\nFROM _MR"
-    order_m = _re.search(r'\nORDER BY .+', sql, _re.DOTALL)
-    limit_m = _re.search(r'\nFETCH FIRST (\d+) ROWS ONLY', sql)
-    offset_m = _re.search(r'\nOFFSET \d+', sql)
-    suffix = ""
+    order_m = _ORDER_BY_TAIL_RE.search(sql)
+    limit_m = _FETCH_FIRST_LINE_RE.search(sql)
+    offset_m = _OFFSET_LINE_RE.search(sql)
+    parts = [outer_sql]
     if order_m:
         start = order_m.start()
         end = limit_m.start() if limit_m and limit_m.start() > start else len(sql)
-        suffix += sql[start:end]
+        parts.append(sql[start:end])
     if limit_m:
-        suffix += f"\nFETCH FIRST {limit_m.group(1)} ROWS ONLY"
+        parts.append(f"\nFETCH FIRST {limit_m.group(1)} ROWS ONLY")
     if offset_m:
-        suffix += f"\nOFFSET {offset_m.group(0).split()[1]}"
-    outer_sql += suffix
-    return outer_sql
+        parts.append(f"\nOFFSET {offset_m.group(0).split()[1]}")
+    return "".join(parts)
 
 
 def _demote_agg_stages_to_subqueries(sql: str, ctes: list) -> tuple:
@@ -1330,7 +1356,7 @@ def _tts_transactional_result(cypher_query, context, metadata, order_by_items):
     if all_ctes and sql is not None:
         sql, all_ctes = _demote_agg_stages_to_subqueries(sql, all_ctes)
         if all_ctes:
-            sql = "WITH " + ",\n".join(all_ctes) + "\n" + sql
+            sql = "".join(("WITH ", ",\n".join(all_ctes), "\n", sql))
         all_params.append(context.all_stage_params + p)
     elif sql is not None:
          all_params.append(p)
@@ -1363,16 +1389,12 @@ def _tts_collect_path_funcs(cypher_query, vl):
         expr = item.expression
         if isinstance(expr, ast.Variable) and expr.name in named_path_vars:
             path_funcs.append("path")
-        elif isinstance(
-            expr, ast.FunctionCall
-        ) and expr.function_name.lower() in (
-            "length",
-            "nodes",
-            "relationships",
-        ):
-            if expr.arguments and isinstance(expr.arguments[0], ast.Variable):
-                if expr.arguments[0].name in named_path_vars:
-                    path_funcs.append(expr.function_name.lower())
+        elif isinstance(expr, ast.FunctionCall):
+            fn = expr.function_name.lower()
+            if fn in ("length", "nodes", "relationships") and expr.arguments:
+                arg = expr.arguments[0]
+                if isinstance(arg, ast.Variable) and arg.name in named_path_vars:
+                    path_funcs.append(fn)
     if path_funcs:
         vl[0]["return_path_funcs"] = path_funcs
 
@@ -1412,12 +1434,11 @@ def _tts_select_result(cypher_query, context, metadata, order_by_items):
             sql = sql.replace("SELECT \nFROM", f"SELECT *\nFROM", 1)
             sql = sql.replace("SELECT DISTINCT \nFROM", f"SELECT DISTINCT *\nFROM", 1)
     if hasattr(context, '_percentile_queries') and context._percentile_queries:
-        import re as _re
-        from_match = _re.search(r'\nFROM\s+(.*?)(?:\nWHERE|\nORDER|\nFETCH|\nGROUP|\nHAVING|$)', sql, _re.DOTALL)
+        from_match = _FROM_CLAUSE_RE.search(sql)
         if from_match and len(context._percentile_queries) == 1:
             from_clause = from_match.group(0).strip()
             val_expr, pct_val, fn_name, var_name, alias = context._percentile_queries[0]
-            col_alias = _re.search(r'AS\s+(\w+)\s*$', sql.split('\n')[0])
+            col_alias = _TRAILING_ALIAS_RE.search(sql.partition('\n')[0])
             out_alias = col_alias.group(1) if col_alias else "result"
             proc = "PCONT" if fn_name == "percentilecont" else "PDISC"
             inner_col = val_expr.split('.')[-1] if '.' in val_expr else val_expr
@@ -1440,7 +1461,7 @@ def _tts_select_result(cypher_query, context, metadata, order_by_items):
     if all_ctes:
         sql, all_ctes = _demote_agg_stages_to_subqueries(sql, all_ctes)
         if all_ctes:
-            sql = "WITH " + ",\n".join(all_ctes) + "\n" + sql
+            sql = "".join(("WITH ", ",\n".join(all_ctes), "\n", sql))
         return SQLQuery(
             sql=sql,
             parameters=[context.all_stage_params + p],
@@ -1499,20 +1520,18 @@ def preprocess_order_by(query: ast.CypherQuery, context: TranslationContext) ->
                     context.where_params = saved_where
                     context.join_params = saved_join
                     context.join_clauses = saved_join_clauses
-    import re as _re
-    _proc_prefix_re = _re.compile(r'^(?:Stage\d+|' + '|'.join(_PROC_CTE_ALIASES) + r')\.')
     for item in query.order_by_clause.items:
         try:
             if (isinstance(item.expression, ast.Variable)
                     and item.expression.name in alias_to_sql):
-                expr = _proc_prefix_re.sub('', alias_to_sql[item.expression.name])
+                expr = _PROC_PREFIX_RE.sub('', alias_to_sql[item.expression.name])
             else:
                 expr = translate_expression(item.expression, context, segment="where")
-                expr = _proc_prefix_re.sub('', expr)
+                expr = _PROC_PREFIX_RE.sub('', expr)
         except ValueError:
             if (isinstance(item.expression, ast.Variable)
                     and item.expression.name in alias_to_sql):
-                expr = _proc_prefix_re.sub('', alias_to_sql[item.expression.name])
+                expr = _PROC_PREFIX_RE.sub('', alias_to_sql[item.expression.name])
             else:
                 raise
         items.append(f"{expr} {'ASC' if item.ascending else 'DESC'}")
@@ -1526,8 +1545,8 @@ def _resolve_pagination_value(value, context: TranslationContext) -> Optional[in
     if isinstance(value, int):
         return value
     if isinstance(value, ast.Variable):
-        resolved = context.input_params.get(value.name)
-        if resolved is None:
+        resolved = context.input_params.get(value.name, _MISSING)
+        if resolved is _MISSING or resolved is None:
             raise ValueError(
                 f"Parameter '${value.name}' used in SKIP/LIMIT but not provided in params dict"
             )
@@ -1542,11 +1561,11 @@ def apply_pagination(
     order_by_items: list = None,
 ) -> str:
     if order_by_items:
-        sql += f"\nORDER BY {', '.join(order_by_items)}"
+        sql = f"{sql}\nORDER BY {', '.join(order_by_items)}"
     limit = _resolve_pagination_value(query.limit, context)
     skip = _resolve_pagination_value(query.skip, context)
     if limit is not None or skip is not None:
-        if "\nFROM " not in sql and "FROM " not in sql.split("\n")[0]:
+        if "\nFROM " not in sql and "FROM " not in sql.partition("\n")[0]:
             sql = sql.rstrip() + "\nFROM (SELECT 1) __dual"
     # Build-106 workaround: IRIS 2026.3.0AI build 106 SIGSEGVs in %qaqpre when a
     # multi-table JOIN is combined with `FETCH FIRST n ROWS ONLY` on VARCHAR-keyed
@@ -1560,7 +1579,7 @@ def apply_pagination(
         and skip is None
         and fetch_first_unsafe
         and sql.lstrip().upper().startswith("SELECT ")
-        and " TOP " not in sql.split("\n", 1)[0].upper()
+        and " TOP " not in sql.partition("\n")[0].upper()
     ):
         # Inject `TOP n` right after the leading SELECT (and after DISTINCT if present).
         head, sep, rest = sql.partition("SELECT ")
@@ -1569,11 +1588,12 @@ def apply_pagination(
         else:
             rest = f"TOP {limit} " + rest
         return head + sep + rest
+    tail = [sql]
     if limit is not None:
-        sql += f"\nFETCH FIRST {limit} ROWS ONLY"
+        tail.append(f"\nFETCH FIRST {limit} ROWS ONLY")
     if skip is not None:
-        sql += f"\nOFFSET {skip}"
-    return sql
+        tail.append(f"\nOFFSET {skip}")
+    return "".join(tail)
 
 
 def translate_updating_clause(upd, context, metadata):
@@ -2793,30 +2813,61 @@ def _boolean_expr_comparison_ops(op, left, left_expr, right, right_expr) -> Opti
     return None
 
 
-def _boolean_expr_logical(op, expr, context):
+_LOGICAL_OPS = frozenset(
+    {
+        ast.BooleanOperator.AND,
+        ast.BooleanOperator.OR,
+        ast.BooleanOperator.XOR,
+        ast.BooleanOperator.NOT,
+    }
+)
+
+
+def _logical_operands(expr, context):
+    op = expr.operator
+    if op == ast.BooleanOperator.AND:
+        return (o for o in expr.operands if not _is_temporal_ts_condition(o, context))
+    if op == ast.BooleanOperator.XOR:
+        return iter(expr.operands[:2])
+    if op == ast.BooleanOperator.NOT:
+        return iter(expr.operands[:1])
+    return iter(expr.operands)
+
+
+def _join_logical(op, parts) -> str:
     if op == ast.BooleanOperator.AND:
-        parts = []
-        for o in expr.operands:
-            if _is_temporal_ts_condition(o, context):
-                continue
-            parts.append(translate_boolean_expression(o, context))
         return "(" + " AND ".join(parts) + ")" if parts else "1=1"
     if op == ast.BooleanOperator.OR:
-        return (
-            "("
-            + " OR ".join(
-                translate_boolean_expression(o, context) for o in expr.operands
-            )
-            + ")"
-        )
+        return "(" + " OR ".join(parts) + ")"
     if op == ast.BooleanOperator.XOR:
-        a, b = expr.operands[0], expr.operands[1]
-        sa = translate_boolean_expression(a, context)
-        sb = translate_boolean_expression(b, context)
+        sa, sb = parts
         return f"(({sa} AND NOT ({sb})) OR (NOT ({sa}) AND {sb}))"
-    if op == ast.BooleanOperator.NOT:
-        return f"NOT ({translate_boolean_expression(expr.operands[0], context)})"
-    return None
+    return f"NOT ({parts[0]})"
+
+
+def _boolean_expr_logical(op, expr, context):
+    if op not in _LOGICAL_OPS:
+        return None
+    # Post-order walk on an explicit stack: nested AND/OR/XOR/NOT nodes are
+    # pushed rather than recursed into, so a long left-nested chain costs no
+    # Python frames; leaves are still translated left to right, keeping the
+    # WHERE parameter order identical to the recursive form.
+    end = object()
+    stack = [(expr, _logical_operands(expr, context), [])]
+    while True:
+        node, operands, parts = stack[-1]
+        child = next(operands, end)
+        if child is not end:
+            if isinstance(child, ast.BooleanExpression) and child.operator in _LOGICAL_OPS:
+                stack.append((child, _logical_operands(child, context), []))
+            else:
+                parts.append(translate_boolean_expression(child, context))
+            continue
+        stack.pop()
+        sql = _join_logical(node.operator, parts)
+        if not stack:
+            return sql
+        stack[-1][2].append(sql)
 
 
 def _boolean_expr_in(left, right_expr, context):
@@ -3290,8 +3341,8 @@ def _expr_variable(expr, context, segment):
                 return "1" if val else "0"
             return str(val)
     if not alias:
-        if expr.name in context.input_params:
-            v = context.input_params[expr.name]
+        v = context.input_params.get(expr.name, _MISSING)
+        if v is not _MISSING:
             if segment == "select":
                 return context.add_select_param(v)
             if segment == "join":
@@ -3366,11 +3417,9 @@ def _expr_aggregation(expr, context, segment):
             if expr.argument
             else "*"
         )
-    fn = (
-        "JSON_ARRAYAGG"
-        if expr.function_name.upper() == "COLLECT"
-        else expr.function_name.upper()
-    )
+    fn = expr.function_name.upper()
+    if fn == "COLLECT":
+        fn = "JSON_ARRAYAGG"
     return f"{fn}({'DISTINCT ' if expr.distinct else ''}{arg})"
 
 
@@ -3656,6 +3705,38 @@ def _expr_fn_list_ops(fn, args, args_exprs):
     return None
 
 
+# Cypher function name (lower-cased) -> IRIS SQL function; built once at import
+# rather than on every function-call translation.
+_CYPHER_FN_MAP = {
+    "tolower": "LOWER",
+    "toupper": "UPPER",
+    "trim": "TRIM",
+    "ltrim": "LTRIM",
+    "rtrim": "RTRIM",
+    "tostring": "CAST",
+    "tointeger": "CAST",
+    "tofloat": "CAST",
+    "size": "LENGTH",
+    "length": "LENGTH",
+    "substring": "SUBSTRING",
+    "left": "LEFT",
+    "right": "RIGHT",
+    "split": "STRTOK_TO_TABLE",
+    "replace": "REPLACE",
+    "reverse": "REVERSE",
+    "abs": "ABS",
+    "ceil": "CEILING",
+    "floor": "FLOOR",
+    "round": "ROUND",
+    "sqrt": "SQRT",
+    "sign": "SIGN",
+    "coalesce": "COALESCE",
+    "nullif": "NULLIF",
+    "exists": "EXISTS",
+    "toboolean": "CASE WHEN",
+}
+
+
 def _expr_function_call(expr, context, segment):
     fn = expr.function_name.lower()
 
@@ -3698,35 +3779,7 @@ def _expr_function_call(expr, context, segment):
     if result is not None:
         return result
 
-    _CYPHER_FN_MAP = {
-        "tolower": "LOWER",
-        "toupper": "UPPER",
-        "trim": "TRIM",
-        "ltrim": "LTRIM",
-        "rtrim": "RTRIM",
-        "tostring": "CAST",
-        "tointeger": "CAST",
-        "tofloat": "CAST",
-        "size": "LENGTH",
-        "length": "LENGTH",
-        "substring": "SUBSTRING",
-        "left": "LEFT",
-        "right": "RIGHT",
-        "split": "STRTOK_TO_TABLE",
-        "replace": "REPLACE",
-        "reverse": "REVERSE",
-        "abs": "ABS",
-        "ceil": "CEILING",
-        "floor": "FLOOR",
-        "round": "ROUND",
-        "sqrt": "SQRT",
-        "sign": "SIGN",
-        "coalesce": "COALESCE",
-        "nullif": "NULLIF",
-        "exists": "EXISTS",
-        "toboolean": "CASE WHEN",
-    }
-    sql_fn = _CYPHER_FN_MAP.get(fn, fn.upper())
+    sql_fn = _CYPHER_FN_MAP.get(fn) or fn.upper()
     scalar_result = _expr_scalar_function(fn, sql_fn, args, expr.arguments, expr, context, segment)
     if scalar_result is not None:
         return scalar_result
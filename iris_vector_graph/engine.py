@@ -7,7 +7,9 @@ Provides vector search, text search, graph traversal, and hybrid fusion capabili
 that can be used across any domain.
 """
 
+from collections import OrderedDict
 import json
+import threading
 from pathlib import Path
 from typing import Callable, List, Tuple, Optional, Dict, Any
 import logging
@@ -147,6 +149,9 @@ class IRISGraphEngine(RdfExportMixin, ShaclMixin, ProvMixin, TemporalMixin, Snap
         self._native_conn = None  # dedicated connection for iris.createIRIS — never used for cursor DDL
         self._index_registry: Dict[str, str] = self._build_index_registry()
         self._pending_index_config: Dict[str, Any] = {}
+        self._query_embedding_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._query_embedding_source: Optional[tuple] = None  # (embedder, embedding_config) the cache was filled with
+        self._query_embedding_lock = threading.Lock()
         if vector_dtype == "DOUBLE":
             self.vector_dtype = self._detect_stored_vector_dtype()
         if store is None:
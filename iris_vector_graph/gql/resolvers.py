@@ -64,7 +64,7 @@ async def resolve_semantic_search(
             else:
                 # Mode 1 Fallback: Embed in Python
                 try:
-                    vector = engine.embed_text(query)
+                    vector = engine._embed_query(query)
                     query_input = json.dumps(vector)
                 except Exception as e:
                     import logging
@@ -318,6 +318,34 @@ CREATE INDEX idx_edges_confidence ON Graph_KG.rdf_edges(JSON_VALUE(qualifiers, '
 
         return status
 
+    @staticmethod
+    def ensure_vector_indexes(cursor, dimension: int) -> Dict[str, bool]:
+        """
+        Create the cosine HNSW index on kg_NodeEmbeddings.emb if it doesn't exist.
+
+        Uses the same name and parameters as ``HNSW_NodeEmb`` in sql/schema.sql,
+        so databases built from that file are not given a second HNSW index.
+        Kept separate from :meth:`ensure_indexes` because the HNSW build is
+        expensive on populated tables; callers opt in.
+
+        Returns:
+            Dict mapping index name to success status
+        """
+        from .dbapi_utils import create_hnsw_index
+
+        name = "HNSW_NodeEmb"
+        ok = create_hnsw_index(
+            cursor,
+            "Graph_KG.kg_NodeEmbeddings",
+            "emb",
+            dimension,
+            metric="Cosine",
+            m=16,
+            ef_construction=100,
+            index_name=name,
+        )
+        return {name: ok}
+
     @staticmethod
     def update_spo_unique_constraint(cursor) -> bool:
         try:
@@ -1,5 +1,27 @@
+import json
 import re
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(raw):
+    """json.loads, through orjson when it is installed.
+
+    orjson rejects a few documents the stdlib accepts (NaN, ints wider than
+    64 bits); those are retried with json.loads so the result never depends
+    on which decoder is present.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def _split_sql_statements(sql: str) -> list[str]:
     """Split SQL content into individual statements robustly."""
     statements = []
@@ -159,6 +159,30 @@ def _ensure_nodes_exist(connection, sql_content):
     connection.commit()
 
 
+# Statement the server accepted last time; the syntax does not change between
+# connections to the same IRIS build, so only the first call probes both.
+_DEFAULT_SCHEMA_STMT = None
+
+
+def _set_default_schema(cursor, schema: str = "Graph_KG") -> None:
+    """Make `schema` the session default, using whichever syntax this IRIS supports."""
+    global _DEFAULT_SCHEMA_STMT
+    if _DEFAULT_SCHEMA_STMT is not None:
+        try:
+            cursor.execute(_DEFAULT_SCHEMA_STMT.format(schema=schema))
+            return
+        except Exception:
+            _DEFAULT_SCHEMA_STMT = None
+    for stmt in ("SET OPTION DEFAULT_SCHEMA = {schema}", "SET SCHEMA {schema}"):
+        try:
+            cursor.execute(stmt.format(schema=schema))
+        except Exception:
+            continue
+        _DEFAULT_SCHEMA_STMT = stmt
+        return
+    logger.debug("Could not set default schema %s; using fully qualified names", schema)
+
+
 def load_sql_file(connection, sql_file_path):
     """Load and execute a SQL file robustly.
     
@@ -181,15 +205,7 @@ def load_sql_file(connection, sql_file_path):
     statements = _split_sql_statements(sql_content)
     
     cursor = connection.cursor()
-    try:
-        # Set default schema for the session
-        cursor.execute("SET OPTION DEFAULT_SCHEMA = Graph_KG")
-    except Exception:
-        # Fallback if SET OPTION is not supported
-        try:
-            cursor.execute("SET SCHEMA Graph_KG")
-        except Exception:
-            pass
+    _set_default_schema(cursor)
         
     for stmt in statements:
         stmt = stmt.strip()
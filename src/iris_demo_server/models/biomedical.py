@@ -95,6 +95,59 @@ class SimilaritySearchResult(BaseModel):
         }
 
 
+class SimilaritySearchResultSoA(BaseModel):
+    """Protein search results as parallel columns (one entry per hit, FR-007)"""
+    protein_ids: List[str] = Field(default_factory=list, description="Protein identifiers")
+    names: List[str] = Field(default_factory=list, description="Protein names")
+    functions: List[str] = Field(default_factory=list, description="Functional annotations")
+    scores: List[float] = Field(default_factory=list, description="Scores 0.0-1.0")
+    organism: str = Field(default="Homo sapiens", description="Source organism for all hits")
+    search_method: str = Field(..., description="vector|text|hybrid")
+
+    @field_validator('scores')
+    @classmethod
+    def validate_scores(cls, v, info):
+        for score in v:
+            if not 0.0 <= score <= 1.0:
+                raise ValueError(f'Similarity score {score} must be 0.0-1.0')
+
+        protein_ids = info.data.get('protein_ids', [])
+        if protein_ids and len(v) != len(protein_ids):
+            raise ValueError('scores length must match protein_ids length')
+        return v
+
+    @property
+    def proteins(self) -> List[Protein]:
+        """Row view for callers that still expect Protein objects"""
+        return [
+            Protein(protein_id=pid, name=name, organism=self.organism, function_description=fn)
+            for pid, name, fn in zip(self.protein_ids, self.names, self.functions)
+        ]
+
+    @property
+    def similarity_scores(self) -> List[float]:
+        return self.scores
+
+    def legacy_dump(self) -> Dict[str, Any]:
+        """SimilaritySearchResult-shaped dict (the /api/bio/search JSON contract), built from the columns"""
+        organism = self.organism
+        return {
+            "proteins": [
+                {
+                    "protein_id": pid,
+                    "name": name,
+                    "organism": organism,
+                    "sequence": None,
+                    "function_description": fn,
+                    "vector_embedding": None,
+                }
+                for pid, name, fn in zip(self.protein_ids, self.names, self.functions)
+            ],
+            "similarity_scores": list(self.scores),
+            "search_method": self.search_method,
+        }
+
+
 class Interaction(BaseModel):
     """Protein-protein interaction with confidence score"""
     source_protein_id: str = Field(..., min_length=1, description="Source protein")
@@ -164,6 +217,14 @@ class InteractionNetwork(BaseModel):
         }
 
 
+class SearchAndExpandResult(BaseModel):
+    """Protein search plus interaction networks for the top hits, in one response"""
+    search: SimilaritySearchResultSoA = Field(..., description="Search hits")
+    networks: Dict[str, InteractionNetwork] = Field(
+        default_factory=dict, description="Interaction network per expanded protein_id"
+    )
+
+
 class PathwayQuery(BaseModel):
     """Request for shortest pathway between proteins (FR-019)"""
     source_protein_id: str = Field(..., min_length=1, description="Starting protein")
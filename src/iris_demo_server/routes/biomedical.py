@@ -1,5 +1,6 @@
 """Biomedical research demo routes (Life Sciences)"""
 from fasthtml.common import *
+from starlette.exceptions import HTTPException
 from typing import Dict, Any
 import time
 import os
@@ -7,7 +8,6 @@ from datetime import datetime
 
 from ..models.biomedical import (
     ProteinSearchQuery,
-    SimilaritySearchResult,
     PathwayQuery,
     PathwayResult,
     QueryType
@@ -457,7 +457,7 @@ def register_biomedical_routes(app):
                 query_type="protein_search",
                 execution_time_ms=int((time.time() - start_time) * 1000),
                 backend_used="iris_direct",
-                result_count=len(result.proteins),
+                result_count=len(result.protein_ids),
                 search_methods=[result.search_method],
                 timestamp=datetime.utcnow()
             )
@@ -465,7 +465,7 @@ def register_biomedical_routes(app):
             # Return JSON for API calls (tests), HTML for HTMX frontend
             if is_json_request:
                 return {
-                    "result": result.model_dump(),
+                    "result": result.legacy_dump(),
                     "metrics": metrics.model_dump()
                 }
 
@@ -520,7 +520,7 @@ def register_biomedical_routes(app):
                 Div(style="margin-top: 1.5rem;")(
                     H3("Search Results"),
                     P(style="color: #718096; margin-bottom: 1rem;")(
-                        f"Found {len(result.proteins)} proteins matching query: '{query.query_text}'"
+                        f"Found {len(result.protein_ids)} proteins matching query: '{query.query_text}'"
                     ),
 
                     Table(style="width: 100%; background: white; border-radius: 6px; overflow: hidden;")(
@@ -536,24 +536,24 @@ def register_biomedical_routes(app):
                             *[
                                 Tr(
                                     style="border-top: 1px solid #e2e8f0; cursor: pointer;",
-                                    hx_get=f"/api/bio/network/{protein.protein_id}?expand_depth=1",
+                                    hx_get=f"/api/bio/network/{protein_id}?expand_depth=1",
                                     hx_target="#viz",
                                     hx_swap="outerHTML"
                                 )(
                                     Td(style="padding: 0.75rem;")(
                                         Code(style="background: #f7fafc; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.875rem;")(
-                                            protein.protein_id
+                                            protein_id
                                         )
                                     ),
-                                    Td(style="padding: 0.75rem; font-weight: 500;")(protein.name),
-                                    Td(style="padding: 0.75rem; color: #718096;")(protein.organism),
+                                    Td(style="padding: 0.75rem; font-weight: 500;")(name),
+                                    Td(style="padding: 0.75rem; color: #718096;")(result.organism),
                                     Td(style="padding: 0.75rem; text-align: center;")(
-                                        Span(cls=f"badge {similarity_badge_class(result.similarity_scores[i])}")(
-                                            f"{similarity_label(result.similarity_scores[i])} ({result.similarity_scores[i]:.3f})"
+                                        Span(cls=f"badge {similarity_badge_class(score)}")(
+                                            f"{similarity_label(score)} ({score:.3f})"
                                         )
                                     )
                                 )
-                                for i, protein in enumerate(result.proteins)
+                                for protein_id, name, score in zip(result.protein_ids, result.names, result.scores)
                             ]
                         )
                     ),
@@ -607,6 +607,43 @@ def register_biomedical_routes(app):
                 P(str(e))
             )
 
+    @app.post("/api/bio/search_expand")
+    async def search_and_expand_proteins(request):
+        """Search proteins and return the top hits' interaction networks in one response"""
+        start_time = time.time()
+
+        try:
+            body = await request.json()
+            expand_depth = int(body.pop("expand_depth", 1))
+            max_expanded = int(body.pop("max_expanded", 5))
+            query = ProteinSearchQuery(**body)
+
+            bio_client = get_biomedical_client()
+            result = await bio_client.search_and_expand(query, expand_depth, max_expanded)
+
+            metrics = QueryPerformanceMetrics(
+                query_type="protein_search_expand",
+                execution_time_ms=int((time.time() - start_time) * 1000),
+                backend_used="iris_direct",
+                result_count=len(result.search.protein_ids),
+                search_methods=[result.search.search_method, "graph_neighbors"],
+                timestamp=datetime.utcnow()
+            )
+
+            return {
+                "result": {
+                    "search": result.search.legacy_dump(),
+                    "networks": {pid: net.model_dump() for pid, net in result.networks.items()},
+                },
+                "metrics": metrics.model_dump()
+            }
+
+        except ValueError as e:
+            # Bad JSON, non-integer expand options or pydantic validation
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
     @app.get("/api/bio/network/{protein_id}")
     async def get_protein_network(protein_id: str, expand_depth: int = 1, request=None):
         """Get interaction network for protein (FR-012, FR-013) - T018"""
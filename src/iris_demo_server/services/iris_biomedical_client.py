@@ -1,20 +1,38 @@
 """Direct IRIS client for biomedical queries - showcases IRIS vector + graph capabilities"""
 import os
+import re
 import time
 import iris
 import json
 from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 from ..models.biomedical import (
     Protein,
     ProteinSearchQuery,
-    SimilaritySearchResult,
+    SimilaritySearchResultSoA,
     InteractionNetwork,
     Interaction,
     PathwayQuery,
-    PathwayResult
+    PathwayResult,
+    SearchAndExpandResult
+)
+
+# kg_Documents text format: "Protein NAME with annotation: DESCRIPTION.. Protein size: N amino acids."
+_PROTEIN_RE = re.compile(
+    r"^Protein (?P<name>.+?) with annotation: (?P<fn>.*?)(?:\.\. Protein size:|$)",
+    re.DOTALL,
 )
 
 
+class ProteinNotFoundError(RuntimeError):
+    """Raised when a protein ID has no entry in the graph"""
+
+
 class IRISBiomedicalClient:
     """Direct IRIS client - queries STRING protein data loaded by string_db_scale_test.py"""
 
@@ -41,7 +59,7 @@ class IRISBiomedicalClient:
         except Exception as e:
             raise RuntimeError(f"Failed to connect to IRIS: {e}")
 
-    async def search_proteins(self, query: ProteinSearchQuery) -> SimilaritySearchResult:
+    async def search_proteins(self, query: ProteinSearchQuery) -> SimilaritySearchResultSoA:
         """
         Search proteins using IRIS hybrid search (vector + text + graph)
 
@@ -76,19 +94,24 @@ class IRISBiomedicalClient:
 
             results = cursor.fetchall()
 
-            # Parse results into Protein objects
-            proteins = []
+            # Parse results straight into columns - no per-row Protein objects
+            protein_ids, names, functions = [], [], []
             for node_id, txt in results:
-                proteins.append(self._parse_protein(node_id, txt))
+                protein_id, name, function_desc = self._parse_protein_fields(node_id, txt)
+                protein_ids.append(protein_id)
+                names.append(name)
+                functions.append(function_desc)
 
-            # Generate similarity scores (descending from 1.0)
-            scores = [1.0 - (i * 0.05) for i in range(len(proteins))]
+            # Generate similarity scores (descending from 1.0, floored at 0.0)
+            scores = [max(0.0, 1.0 - (i * 0.05)) for i in range(len(protein_ids))]
 
             execution_time = (time.time() - start_time) * 1000
 
-            return SimilaritySearchResult(
-                proteins=proteins,
-                similarity_scores=scores,
+            return SimilaritySearchResultSoA(
+                protein_ids=protein_ids,
+                names=names,
+                functions=functions,
+                scores=scores,
                 search_method="iris_text_search"
             )
 
@@ -127,7 +150,7 @@ class IRISBiomedicalClient:
 
             props = {row[0]: row[1] for row in cursor.fetchall()}
             if not props:
-                raise ValueError(f"Protein {protein_id} not found")
+                raise ProteinNotFoundError(f"Protein {protein_id} not found")
 
             center_protein = Protein(
                 protein_id=protein_id,
@@ -202,11 +225,37 @@ class IRISBiomedicalClient:
                 layout_hints={"force_strength": -200, "link_distance": 80}
             )
 
+        except ProteinNotFoundError:
+            raise
         except Exception as e:
             raise RuntimeError(f"IRIS network query failed for {protein_id}: {e}")
         finally:
             cursor.close()
 
+    async def search_and_expand(
+        self,
+        query: ProteinSearchQuery,
+        expand_depth: int = 1,
+        max_expanded: int = 5
+    ) -> SearchAndExpandResult:
+        """
+        Search proteins and expand the top hits' interaction networks in one call
+
+        Saves clients the follow-up network request per hit. Expansions run
+        one after another on the client's single IRIS connection. Hits with no
+        graph entry are left out of `networks`; any other failure propagates.
+        """
+        search = await self.search_proteins(query)
+
+        networks = {}
+        for protein_id in search.protein_ids[:max_expanded]:
+            try:
+                networks[protein_id] = await self.get_interaction_network(protein_id, expand_depth)
+            except ProteinNotFoundError:
+                continue
+
+        return SearchAndExpandResult(search=search, networks=networks)
+
     async def find_pathway(self, query: PathwayQuery) -> PathwayResult:
         """
         Find shortest pathway between proteins using IRIS graph traversal
@@ -312,70 +361,84 @@ class IRISBiomedicalClient:
         max_hops: int
     ) -> Optional[List[str]]:
         """BFS pathfinding between proteins"""
-        # Normalize to lowercase for case-insensitive comparison
-        source_lower = source.lower()
-        target_lower = target.lower()
+        # Compare case-insensitively (IRIS may return uppercase)
+        source_key = source.lower()
+        target_key = target.lower()
 
-        if source_lower == target_lower:
+        if source_key == target_key:
             return [source]
 
-        visited = {source_lower}
-        queue = [(source, [source])]
+        # parent pointers replace per-node path copies; names keep the
+        # spelling IRIS returned so the path round-trips into later queries
+        parent: Dict[str, Optional[str]] = {source_key: None}
+        names: Dict[str, str] = {source_key: source}
+        frontier = [source_key]
 
         for _ in range(max_hops):
-            if not queue:
+            if not frontier:
                 break
 
-            new_queue = []
-            for current, path in queue:
-                # Get neighbors (IRIS may return uppercase)
+            next_frontier = []
+            for current_key in frontier:
+                current = names[current_key]
                 cursor.execute("""
                     SELECT o_id FROM rdf_edges WHERE s = ?
                     UNION
                     SELECT s FROM rdf_edges WHERE o_id = ?
                 """, (current, current))
 
-                neighbors = cursor.fetchall()
-
-                for (neighbor,) in neighbors:
-                    neighbor_lower = neighbor.lower()
+                for (neighbor,) in cursor.fetchall():
+                    neighbor_key = neighbor.lower()
+                    if neighbor_key in parent:
+                        continue
+                    parent[neighbor_key] = current_key
+                    names[neighbor_key] = neighbor
 
-                    if neighbor_lower == target_lower:
-                        return path + [neighbor]
+                    if neighbor_key == target_key:
+                        path = []
+                        node_key = neighbor_key
+                        while node_key is not None:
+                            path.append(names[node_key])
+                            node_key = parent[node_key]
+                        path.reverse()
+                        return path
 
-                    if neighbor_lower not in visited:
-                        visited.add(neighbor_lower)
-                        new_queue.append((neighbor, path + [neighbor]))
+                    next_frontier.append(neighbor_key)
 
-            queue = new_queue
+            frontier = next_frontier
 
         return None  # No path found
 
-    def _parse_protein(self, node_id, txt: str) -> Protein:
-        """Parse protein from kg_Documents text field"""
-        # Text format: "Protein NAME with annotation: DESCRIPTION.. Protein size: N amino acids."
-        parts = txt.split(" with annotation: ", 1)
-        if len(parts) == 2:
-            name = parts[0].replace("Protein ", "")
-            function_desc = parts[1].split(".. Protein size:")[0]
+    def _parse_protein_fields(self, node_id, txt: str) -> Tuple[str, str, str]:
+        """Parse (protein_id, name, function_description) from kg_Documents text field"""
+        m = _PROTEIN_RE.match(txt)
+        if m:
+            name, function_desc = m["name"], m["fn"]
+        else:
+            # Text without the leading "Protein " prefix: the original split-based parse
+            parts = txt.split(" with annotation: ", 1)
+            if len(parts) == 2:
+                name = parts[0].replace("Protein ", "")
+                function_desc = parts[1].split(".. Protein size:")[0]
+            else:
+                name = f"Protein {node_id}"
+                function_desc = txt[:200]
+
+        # Convert node_id to ENSEMBL format
+        if isinstance(node_id, int):
+            protein_id = f"ENSP{node_id:011d}"
         else:
-            name = f"Protein {node_id}"
-            function_desc = txt[:200]
+            protein_id = f"ENSP{str(node_id).zfill(11)}"
 
-        return Protein(
-            protein_id=f"ENSP{str(node_id).zfill(11)}",  # Convert node_id to ENSEMBL format
-            name=name,
-            organism="Homo sapiens",  # STRING data is human proteins
-            function_description=function_desc
-        )
+        return protein_id, name, function_desc
 
     def _parse_qualifiers(self, qualifiers_json: Optional[str]) -> Dict:
         """Parse JSON qualifiers from edge"""
         if not qualifiers_json:
             return {}
         try:
-            return json.loads(qualifiers_json)
-        except:
+            return _json_loads(qualifiers_json)
+        except Exception:
             return {}
 
     def close(self):
@@ -0,0 +1,373 @@
+"""Session-scoped IRIS test container and connection fixtures.
+
+The single implementation of ``iris_test_container`` / ``iris_connection``;
+registered for the whole suite via ``pytest_plugins`` in tests/conftest.py so
+container discovery, ObjectScript deploy and connect each run once per session.
+"""
+
+import contextlib
+import logging
+import os
+import subprocess
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+_GQS_CONTAINER = os.environ.get("IVG_TEST_CONTAINER", "ivg-iris")
+
+
+class _IrisSession:
+    """One long-lived ``iris session`` shell inside the test container.
+
+    Spawning ``docker exec ... iris session`` costs a few hundred ms per call, so
+    commands are streamed through a single process instead.  Each command is
+    followed by ``WRITE "__END__",!`` and its output is read back up to that marker.
+    """
+
+    _MARKER = "__END__"
+
+    def __init__(self, container_name: str, namespace: str = "USER"):
+        import queue
+        import threading
+
+        self._proc = subprocess.Popen(
+            ["docker", "exec", "-i", container_name, "iris", "session", "IRIS", "-U", namespace],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1,
+        )
+        self._lines: "queue.Queue" = queue.Queue()
+        self._reader = threading.Thread(target=self._pump, daemon=True)
+        self._reader.start()
+
+    def _pump(self) -> None:
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def run(self, command: str, timeout: float = 30) -> str:
+        """Execute one ObjectScript command and return everything it printed."""
+        import queue
+        import time
+
+        self._proc.stdin.write(f'{command}\nWRITE "{self._MARKER}",!\n')
+        self._proc.stdin.flush()
+        out = []
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError(f"iris session did not answer within {timeout}s: {command}")
+            if line is None:
+                raise RuntimeError(f"iris session exited while running: {command}")
+            if line.rstrip().endswith(self._MARKER):
+                return "".join(out)
+            out.append(line)
+
+    def close(self) -> None:
+        with contextlib.suppress(Exception):
+            self._proc.stdin.write("H\n")
+            self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
+def _stream_sources(container_name: str, files, src_root: str, dest: str) -> None:
+    """Copy `files` into the container with a single tar-over-stdin ``docker exec``."""
+    import io
+    import tarfile
+
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for path in files:
+            tar.add(path, arcname=os.path.relpath(path, src_root).replace(os.sep, "/"))
+    subprocess.run(
+        ["docker", "exec", "-i", container_name, "sh", "-c", f"mkdir -p {dest} && tar -x -C {dest}"],
+        input=buf.getvalue(), capture_output=True,
+    )
+
+
+_SRC_DIGEST_PATH = "/tmp/src/.ivg_src_digest"
+
+
+def _sources_digest(files, src_root: str) -> str:
+    import hashlib
+
+    h = hashlib.sha256()
+    for path in files:
+        h.update(os.path.relpath(path, src_root).encode())
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _deploy_objectscript(container_name: str) -> None:
+    import glob as _glob
+    cls_files = sorted(_glob.glob("iris_src/src/**/*.cls", recursive=True))
+
+    # A reused, already-running container that loaded these exact sources last
+    # session needs no redeploy; skip straight to the tests.
+    digest = _sources_digest(cls_files, "iris_src/src")
+    deployed = subprocess.run(
+        ["docker", "exec", container_name, "cat", _SRC_DIGEST_PATH],
+        capture_output=True, text=True,
+    ).stdout.strip()
+    if deployed == digest:
+        logger.info("ObjectScript sources unchanged in %s; skipping deploy", container_name)
+        return
+
+    # Forget the previous digest first: if this load fails part-way, the
+    # container holds neither the old nor the new sources.
+    subprocess.run(
+        ["docker", "exec", container_name, "rm", "-f", _SRC_DIGEST_PATH],
+        capture_output=True,
+    )
+    _stream_sources(container_name, cls_files, "iris_src/src", "/tmp/src")
+
+    failed = []
+    session = _IrisSession(container_name)
+    try:
+        # Load each .cls file individually with "ck-d" (no background workers).
+        # Community Edition is limited to 2 CPU cores; LoadDir with parallel compilation
+        # fails with ERROR #7802 on machines with many cores because the IRIS work queue
+        # manager spawns more background jobs than the CE license allows.
+        # Loading files one at a time avoids the worker queue entirely.
+        for cls_file in cls_files:
+            # Get the container path relative to /tmp/src/
+            rel = os.path.relpath(cls_file, "iris_src/src").replace(os.sep, "/")
+            out = session.run(f'Do $system.OBJ.Load("/tmp/src/{rel}","ck-d")')
+            if "ERROR #" in out or "errors during" in out:
+                failed.append(rel)
+                logger.warning("ObjectScript load of %s reported errors:\n%s", rel, out)
+    finally:
+        session.close()
+    if failed:
+        # Leave no digest so the next session redeploys instead of trusting
+        # half-compiled classes.
+        logger.warning("ObjectScript deploy had %d failing class(es); not recording digest", len(failed))
+        return
+    subprocess.run(
+        ["docker", "exec", "-i", container_name, "sh", "-c", f"cat > {_SRC_DIGEST_PATH}"],
+        input=digest, capture_output=True, text=True,
+    )
+
+
+def _wait_for_sql(container, attempts: int = 50, interval: float = 0.1) -> None:
+    """Poll ``SELECT 1`` until a freshly started container accepts SQL.
+
+    Returns as soon as the probe succeeds instead of sleeping a fixed interval.
+    Each probe opens its own DB-API connection to the container's published
+    port (public testcontainers API) and closes it, so no probe state is left
+    on the container object and no Community Edition slot is held.
+    """
+    import time
+    import iris.dbapi as _dbapi
+
+    last_error = None
+    for _ in range(attempts):
+        try:
+            conn = _dbapi.connect(
+                hostname=container.get_container_host_ip(),
+                port=int(container.get_exposed_port(1972)),
+                namespace="USER", username="_SYSTEM", password="SYS",
+            )
+            try:
+                cur = conn.cursor()
+                cur.execute("SELECT 1")
+                cur.fetchone()
+                return
+            finally:
+                with contextlib.suppress(Exception):
+                    conn.close()
+        except Exception as e:
+            last_error = e
+            time.sleep(interval)
+    logger.warning("IRIS did not answer SELECT 1 after %d attempts: %s", attempts, last_error)
+
+
+@pytest.fixture(scope="session")
+def iris_test_container():
+    from iris_devtester import IRISContainer
+    import subprocess as _sp
+
+    # Candidate names to try in order before starting a new container.
+    # "iris_vector_graph" is the docker-compose service name; it's a valid
+    # Community container even though it differs from the default fixture name.
+    _FALLBACK_NAMES = ["iris_vector_graph"]
+
+    attached = False
+    container = None
+
+    # 1. Try the configured name.
+    try:
+        container = IRISContainer.attach(_GQS_CONTAINER)
+        attached = True
+        logger.info("Attached to existing container: %s", _GQS_CONTAINER)
+    except Exception:
+        pass
+
+    # 2. If not found, skip rather than start a new container —
+    #    unless IVG_AUTO_START_CONTAINER=1 (default when running in CI).
+    if container is None:
+        auto_start = os.environ.get("IVG_AUTO_START_CONTAINER", "0") not in ("0", "false", "no")
+        if not auto_start:
+            pytest.skip(
+                f"IRIS container '{_GQS_CONTAINER}' not running. "
+                f"Start with: scripts/test-container.sh up  "
+                f"(or set IVG_TEST_CONTAINER=ivg-iris-enterprise for enterprise container)"
+            )
+        _sp.run(["docker", "rm", "-f", _GQS_CONTAINER], capture_output=True)
+        logger.info("Starting fresh Community IRIS container: %s", _GQS_CONTAINER)
+        container = (
+            IRISContainer.community()
+            .with_name(_GQS_CONTAINER)
+            .with_preconfigured_password("SYS")
+            .start()
+        )
+        _wait_for_sql(container)
+
+    name = container.get_container_name()
+    _deploy_objectscript(name)
+
+    yield container
+
+    if not attached:
+        keep = os.environ.get("IVG_KEEP_CONTAINER", "0") in ("1", "true", "yes")
+        if not keep:
+            try:
+                container.stop()
+                logger.info("Stopped container: %s", name)
+            except Exception as e:
+                logger.warning("Could not stop container %s: %s", name, e)
+
+
+@pytest.fixture(scope="session")
+def iris_connection(iris_test_container):
+    import subprocess as _sp
+
+    container_name = iris_test_container.get_container_name()
+    cip = _sp.run(
+        ["docker", "inspect", container_name,
+         "--format", "{{range .NetworkSettings.Networks}}{{.IPAddress}}{{end}}"],
+        capture_output=True, text=True,
+    ).stdout.strip()
+
+    _IVG_PORT = int(os.environ.get("IVG_PORT", "21972"))
+
+    conn = None
+
+    # Try container IP first (Linux Docker where container IPs are routable from host).
+    # On macOS Docker Desktop / OrbStack the container IP is NOT routable from the host,
+    # so we catch the connection error and fall through to the iris_devtester path.
+    if cip:
+        import iris.dbapi as _dbapi
+        try:
+            conn = _dbapi.connect(
+                hostname=cip, port=1972, namespace="USER",
+                username="_SYSTEM", password="SYS",
+            )
+            logger.info("Connected to %s via container IP %s:1972", container_name, cip)
+        except Exception as _e:
+            logger.info(
+                "Container IP %s:1972 not routable from host (%s) — falling back to iris_devtester",
+                cip, _e,
+            )
+            conn = None
+
+    if conn is None:
+        # iris_devtester path: works on macOS Docker Desktop, OrbStack, and Linux.
+        # Also verifies we're NOT accidentally hitting los-iris via an SSH tunnel.
+        try:
+            from iris_devtester import IRISContainer as _IRC
+            _fresh = _IRC.attach(container_name)
+            _fresh._connection = None
+            conn = _fresh.get_connection()
+            _c = conn.cursor()
+            try:
+                _c.execute("SELECT COUNT(*) FROM %Dictionary.CompiledClass WHERE Name='Graph.KG.LOSBriefingJob'")
+                _los_count = _c.fetchone()[0]
+            finally:
+                with contextlib.suppress(Exception):
+                    _c.close()
+            if _los_count > 0:
+                raise RuntimeError(
+                    f"localhost:{_IVG_PORT} is los-iris (SSH tunnel), NOT ivg-iris. "
+                    "Stop the SSH tunnel or configure ivg-iris on a different host port."
+                )
+            logger.info("Connected to %s via iris_devtester", container_name)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.error("Could not connect to %s: %s", container_name, e)
+            raise
+
+    # Install the createIRIS monkeypatch BEFORE any operation touches the session
+    # connection via the native IRIS API.  iris.createIRIS(conn) + cursor DDL on
+    # the same connection permanently corrupts the IRIS Python driver's parameter
+    # binding state.  All code paths that call createIRIS — including schema init,
+    # _call_classmethod, engine._iris_obj() — must be redirected to a dedicated
+    # native connection that never receives cursor DDL.
+    #
+    # Community Edition has a 5-connection limit.  To avoid exhausting it, we use
+    # lazy native-connection creation: the native slot is opened on first demand,
+    # then reused for the life of the session.  This avoids holding an extra
+    # connection open during the large chunks of a test session where _iris_obj()
+    # is never called.
+    import iris as _iris_module
+    _original_createIRIS = _iris_module.createIRIS
+    _native_conn_holder: list = [None]  # mutable cell so the closure can update it
+
+    def _get_or_open_native_conn():
+        if _native_conn_holder[0] is None:
+            try:
+                import iris.dbapi as _dbapi2
+                _native_conn_holder[0] = _dbapi2.connect(
+                    hostname=conn.hostname,
+                    port=conn.port,
+                    namespace=conn.namespace,
+                    username="_SYSTEM",
+                    password="SYS",
+                )
+            except Exception as _e:
+                logger.warning("Could not create native conn for session isolation: %s", _e)
+        return _native_conn_holder[0]
+
+    def _safe_createIRIS(target_conn):
+        if target_conn is conn:
+            native = _get_or_open_native_conn()
+            if native is not None:
+                return _original_createIRIS(native)
+        return _original_createIRIS(target_conn)
+
+    _iris_module.createIRIS = _safe_createIRIS
+
+    from iris_vector_graph.engine import IRISGraphEngine
+    from iris_vector_graph.schema import GraphSchema
+
+    with contextlib.suppress(Exception):
+        cur = conn.cursor()
+        try:
+            GraphSchema.add_graph_id_column(cur)
+            GraphSchema.update_spo_unique_constraint(cur)
+            GraphSchema.add_graph_id_index(cur)
+            conn.commit()
+        finally:
+            with contextlib.suppress(Exception):
+                cur.close()
+
+    try:
+        eng = IRISGraphEngine(conn, embedding_dimension=128)
+        eng.initialize_schema(auto_deploy_objectscript=False)
+    except Exception as e:
+        logger.warning("Schema init failed (may already exist): %s", e)
+
+    yield conn
+
+    _iris_module.createIRIS = _original_createIRIS
+    with contextlib.suppress(Exception):
+        if _native_conn_holder[0] is not None:
+            _native_conn_holder[0].close()
+    conn.close()
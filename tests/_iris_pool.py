@@ -0,0 +1,20 @@
+"""Connection helpers shared by the test suites."""
+
+import os
+
+
+def open_sibling(conn):
+    """Open a new, caller-owned connection to the same server/namespace as `conn`.
+
+    For tests that need one connection per worker thread (DB-API connections
+    are not shared across threads). Mind the Community Edition 5-connection cap.
+    """
+    import iris.dbapi as _dbapi
+
+    return _dbapi.connect(
+        hostname=conn.hostname,
+        port=conn.port,
+        namespace=conn.namespace,
+        username=os.getenv("IRIS_USERNAME", "_SYSTEM"),
+        password=os.getenv("IRIS_PASSWORD", "SYS"),
+    )
@@ -2,224 +2,15 @@ import contextlib
 import logging
 import os
 import re
-import subprocess
 import uuid
 
 import pytest
 
 logger = logging.getLogger(__name__)
 
-_GQS_CONTAINER = os.environ.get("IVG_TEST_CONTAINER", "ivg-iris")
+pytest_plugins = ["tests._fixtures.connection"]
 
-
-def _deploy_objectscript(container_name: str) -> None:
-    subprocess.run(
-        ["docker", "exec", container_name, "mkdir", "-p", "/tmp/src"],
-        capture_output=True,
-    )
-    subprocess.run(
-        ["docker", "cp", "iris_src/src/.", f"{container_name}:/tmp/src/"],
-        capture_output=True,
-    )
-    # Load each .cls file individually with "ck-d" (no background workers).
-    # Community Edition is limited to 2 CPU cores; LoadDir with parallel compilation
-    # fails with ERROR #7802 on machines with many cores because the IRIS work queue
-    # manager spawns more background jobs than the CE license allows.
-    # Loading files one at a time avoids the worker queue entirely.
-    import glob as _glob
-    cls_files = sorted(_glob.glob("iris_src/src/**/*.cls", recursive=True))
-    for cls_file in cls_files:
-        # Get the container path relative to /tmp/src/
-        rel = os.path.relpath(cls_file, "iris_src/src").replace(os.sep, "/")
-        subprocess.run(
-            ["docker", "exec", "-i", container_name, "iris", "session", "IRIS", "-U", "USER"],
-            input=f'Do $system.OBJ.Load("/tmp/src/{rel}","ck-d")\nH\n',
-            capture_output=True, text=True, timeout=30,
-        )
-
-
-@pytest.fixture(scope="session")
-def iris_test_container():
-    from iris_devtester import IRISContainer
-    import subprocess as _sp
-
-    # Candidate names to try in order before starting a new container.
-    # "iris_vector_graph" is the docker-compose service name; it's a valid
-    # Community container even though it differs from the default fixture name.
-    _FALLBACK_NAMES = ["iris_vector_graph"]
-
-    attached = False
-    container = None
-
-    # 1. Try the configured name.
-    try:
-        container = IRISContainer.attach(_GQS_CONTAINER)
-        attached = True
-        logger.info("Attached to existing container: %s", _GQS_CONTAINER)
-    except Exception:
-        pass
-
-    # 2. If not found, skip rather than start a new container —
-    #    unless IVG_AUTO_START_CONTAINER=1 (default when running in CI).
-    if container is None:
-        auto_start = os.environ.get("IVG_AUTO_START_CONTAINER", "0") not in ("0", "false", "no")
-        if not auto_start:
-            pytest.skip(
-                f"IRIS container '{_GQS_CONTAINER}' not running. "
-                f"Start with: scripts/test-container.sh up  "
-                f"(or set IVG_TEST_CONTAINER=ivg-iris-enterprise for enterprise container)"
-            )
-        _sp.run(["docker", "rm", "-f", _GQS_CONTAINER], capture_output=True)
-        logger.info("Starting fresh Community IRIS container: %s", _GQS_CONTAINER)
-        container = (
-            IRISContainer.community()
-            .with_name(_GQS_CONTAINER)
-            .with_preconfigured_password("SYS")
-            .start()
-        )
-
-    name = container.get_container_name()
-    _deploy_objectscript(name)
-
-    yield container
-
-    if not attached:
-        keep = os.environ.get("IVG_KEEP_CONTAINER", "0") in ("1", "true", "yes")
-        if not keep:
-            try:
-                container.stop()
-                logger.info("Stopped container: %s", name)
-            except Exception as e:
-                logger.warning("Could not stop container %s: %s", name, e)
-
-
-@pytest.fixture(scope="session")
-def iris_connection(iris_test_container):
-    import subprocess as _sp
-
-    container_name = iris_test_container.get_container_name()
-    cip = _sp.run(
-        ["docker", "inspect", container_name,
-         "--format", "{{range .NetworkSettings.Networks}}{{.IPAddress}}{{end}}"],
-        capture_output=True, text=True,
-    ).stdout.strip()
-
-    _IVG_PORT = int(os.environ.get("IVG_PORT", "21972"))
-
-    conn = None
-
-    # Try container IP first (Linux Docker where container IPs are routable from host).
-    # On macOS Docker Desktop / OrbStack the container IP is NOT routable from the host,
-    # so we catch the connection error and fall through to the iris_devtester path.
-    if cip:
-        import iris.dbapi as _dbapi
-        try:
-            conn = _dbapi.connect(
-                hostname=cip, port=1972, namespace="USER",
-                username="_SYSTEM", password="SYS",
-            )
-            logger.info("Connected to %s via container IP %s:1972", container_name, cip)
-        except Exception as _e:
-            logger.info(
-                "Container IP %s:1972 not routable from host (%s) — falling back to iris_devtester",
-                cip, _e,
-            )
-            conn = None
-
-    if conn is None:
-        # iris_devtester path: works on macOS Docker Desktop, OrbStack, and Linux.
-        # Also verifies we're NOT accidentally hitting los-iris via an SSH tunnel.
-        try:
-            from iris_devtester import IRISContainer as _IRC
-            _fresh = _IRC.attach(container_name)
-            _fresh._connection = None
-            conn = _fresh.get_connection()
-            _c = conn.cursor()
-            try:
-                _c.execute("SELECT COUNT(*) FROM %Dictionary.CompiledClass WHERE Name='Graph.KG.LOSBriefingJob'")
-                _los_count = _c.fetchone()[0]
-            finally:
-                with contextlib.suppress(Exception):
-                    _c.close()
-            if _los_count > 0:
-                raise RuntimeError(
-                    f"localhost:{_IVG_PORT} is los-iris (SSH tunnel), NOT ivg-iris. "
-                    "Stop the SSH tunnel or configure ivg-iris on a different host port."
-                )
-            logger.info("Connected to %s via iris_devtester", container_name)
-        except RuntimeError:
-            raise
-        except Exception as e:
-            logger.error("Could not connect to %s: %s", container_name, e)
-            raise
-
-    # Install the createIRIS monkeypatch BEFORE any operation touches the session
-    # connection via the native IRIS API.  iris.createIRIS(conn) + cursor DDL on
-    # the same connection permanently corrupts the IRIS Python driver's parameter
-    # binding state.  All code paths that call createIRIS — including schema init,
-    # _call_classmethod, engine._iris_obj() — must be redirected to a dedicated
-    # native connection that never receives cursor DDL.
-    #
-    # Community Edition has a 5-connection limit.  To avoid exhausting it, we use
-    # lazy native-connection creation: the native slot is opened on first demand,
-    # then reused for the life of the session.  This avoids holding an extra
-    # connection open during the large chunks of a test session where _iris_obj()
-    # is never called.
-    import iris as _iris_module
-    _original_createIRIS = _iris_module.createIRIS
-    _native_conn_holder: list = [None]  # mutable cell so the closure can update it
-
-    def _get_or_open_native_conn():
-        if _native_conn_holder[0] is None:
-            try:
-                import iris.dbapi as _dbapi2
-                _native_conn_holder[0] = _dbapi2.connect(
-                    hostname=conn.hostname,
-                    port=conn.port,
-                    namespace=conn.namespace,
-                    username="_SYSTEM",
-                    password="SYS",
-                )
-            except Exception as _e:
-                logger.warning("Could not create native conn for session isolation: %s", _e)
-        return _native_conn_holder[0]
-
-    def _safe_createIRIS(target_conn):
-        if target_conn is conn:
-            native = _get_or_open_native_conn()
-            if native is not None:
-                return _original_createIRIS(native)
-        return _original_createIRIS(target_conn)
-
-    _iris_module.createIRIS = _safe_createIRIS
-
-    from iris_vector_graph.engine import IRISGraphEngine
-    from iris_vector_graph.schema import GraphSchema
-
-    with contextlib.suppress(Exception):
-        cur = conn.cursor()
-        try:
-            GraphSchema.add_graph_id_column(cur)
-            GraphSchema.update_spo_unique_constraint(cur)
-            GraphSchema.add_graph_id_index(cur)
-            conn.commit()
-        finally:
-            with contextlib.suppress(Exception):
-                cur.close()
-
-    try:
-        eng = IRISGraphEngine(conn, embedding_dimension=128)
-        eng.initialize_schema(auto_deploy_objectscript=False)
-    except Exception as e:
-        logger.warning("Schema init failed (may already exist): %s", e)
-
-    yield conn
-
-    _iris_module.createIRIS = _original_createIRIS
-    with contextlib.suppress(Exception):
-        if _native_conn_holder[0] is not None:
-            _native_conn_holder[0].close()
-    conn.close()
+from tests._fixtures.connection import _GQS_CONTAINER  # noqa: E402
 
 
 _ARNO_CONTAINER = os.environ.get("IVG_ARNO_CONTAINER", "ivg-iris-enterprise")
@@ -394,28 +185,132 @@ def arno_master_cleanup(arno_iris_connection):
 
 @pytest.fixture(scope="function")
 def iris_cursor(iris_connection):
+    """Per-test cursor whose uncommitted writes are undone at teardown.
+
+    Only uncommitted work is rolled back. Tests that call commit() (or run DDL,
+    which commits implicitly) must clean up their own rows with the per-table
+    DELETE pattern instead of relying on this fixture.
+    """
     cursor = iris_connection.cursor()
     with contextlib.suppress(Exception):
         cursor.execute("SET SCHEMA SQLUser")
+    savepoint = False
+    with contextlib.suppress(Exception):
+        cursor.execute("SAVEPOINT sp_test")
+        savepoint = True
     try:
         yield cursor
     finally:
+        if savepoint:
+            with contextlib.suppress(Exception):
+                cursor.execute("ROLLBACK TO SAVEPOINT sp_test")
+        # Always end the outer transaction too: SAVEPOINT opened one on the
+        # shared session connection, and leaving it open would hold this
+        # test's locks into every later test.
         with contextlib.suppress(Exception):
             iris_connection.rollback()
         with contextlib.suppress(Exception):
             cursor.close()
 
 
+@pytest.fixture(scope="session")
+def iris_cursor_ro(iris_connection):
+    """One cursor shared by read-only tests for the whole session.
+
+    Cursors are cheap to reuse but not to construct; tests that only SELECT
+    (vector search, lookups) should take this instead of opening their own.
+    Never write through it — there is no rollback isolation.
+    """
+    cursor = iris_connection.cursor()
+    try:
+        yield cursor
+    finally:
+        with contextlib.suppress(Exception):
+            cursor.close()
+
+
+@pytest.fixture(scope="session")
+def _schema_ok(iris_connection):
+    """Fail fast if the graph tables that seeding fixtures write to are missing.
+
+    Seeding fixtures depend on this and run their inserts unguarded, so a broken
+    schema surfaces once here instead of as swallowed errors in every module.
+    """
+    cursor = iris_connection.cursor()
+    try:
+        for sql in (
+            "SELECT TOP 0 node_id FROM Graph_KG.nodes",
+            "SELECT TOP 0 s, label FROM Graph_KG.rdf_labels",
+            "SELECT TOP 0 id, emb FROM Graph_KG.kg_NodeEmbeddings",
+        ):
+            try:
+                cursor.execute(sql)
+                cursor.fetchall()
+            except Exception as e:
+                raise RuntimeError(f"Graph_KG schema not ready ({sql}): {e}") from e
+    finally:
+        with contextlib.suppress(Exception):
+            cursor.close()
+    return True
+
+
+_CLEANUP_TABLES = (
+    ("kg_NodeEmbeddings", "id"),
+    ("rdf_edges", "s"),
+    ("rdf_props", "s"),
+    ("rdf_labels", "s"),
+    ("nodes", "node_id"),
+)
+
+
+@pytest.fixture(scope="session")
+def _test_cleanup_proc(iris_connection):
+    """Create a SQL procedure that purges all test rows for a prefix in one call.
+
+    Yields False if the procedure could not be created; clean_test_data then
+    falls back to one DELETE per table.
+    """
+    body = "\n".join(
+        f"  DELETE FROM {t} WHERE {col} %STARTSWITH :prefix;" for t, col in _CLEANUP_TABLES
+    )
+    cursor = iris_connection.cursor()
+    created = False
+    try:
+        with contextlib.suppress(Exception):
+            cursor.execute("DROP PROCEDURE TestCleanup_Purge")
+        try:
+            cursor.execute(
+                "CREATE PROCEDURE TestCleanup_Purge(IN prefix VARCHAR(256))\n"
+                f"BEGIN\n{body}\nEND"
+            )
+            iris_connection.commit()
+            created = True
+        except Exception as e:
+            logger.info("TestCleanup_Purge not created, using per-table DELETEs: %s", e)
+            with contextlib.suppress(Exception):
+                iris_connection.rollback()
+        yield created
+        if created:
+            with contextlib.suppress(Exception):
+                cursor.execute("DROP PROCEDURE TestCleanup_Purge")
+                iris_connection.commit()
+    finally:
+        with contextlib.suppress(Exception):
+            cursor.close()
+
+
 @pytest.fixture(scope="function")
-def clean_test_data(iris_connection):
+def clean_test_data(iris_connection, _test_cleanup_proc):
     prefix = f"TEST_{uuid.uuid4().hex[:8]}:"
     yield prefix
     cursor = iris_connection.cursor()
     try:
         with contextlib.suppress(Exception):
-            for t in ["kg_NodeEmbeddings", "rdf_edges", "rdf_props", "rdf_labels", "nodes"]:
-                col = "id" if "Emb" in t else "node_id" if t == "nodes" else "s"
-                cursor.execute(f"DELETE FROM {t} WHERE {col} LIKE ?", (f"{prefix}%",))
+            if _test_cleanup_proc:
+                cursor.execute("CALL TestCleanup_Purge(?)", (prefix,))
+            else:
+                for t, col in _CLEANUP_TABLES:
+                    cursor.execute(f"DELETE FROM {t} WHERE {col} LIKE ?", (f"{prefix}%",))
             iris_connection.commit()
     finally:
         with contextlib.suppress(Exception):
@@ -433,7 +328,10 @@ def pytest_configure(config):
 
 
 def pytest_addoption(parser):
-    pass
+    parser.addoption(
+        "--parallel", action="store_true", default=False,
+        help="Run independent read-only benchmark queries on concurrent connections",
+    )
 
 
 def pytest_collect_file(parent, file_path):
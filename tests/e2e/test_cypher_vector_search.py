@@ -10,7 +10,6 @@ SKIP_IRIS_TESTS defaults to "false" — tests always hit live IRIS.
 Constitution Principle IV: mandatory e2e coverage, no hardcoded ports.
 """
 
-import json
 import os
 import time
 import pytest
@@ -40,22 +39,27 @@ VEC_DRUG_A = _vec(0.8, 0.2, 0.0)   # Drug label
 VEC_QUERY  = _vec(1.0, 0.0, 0.0)   # query vector
 
 
-@pytest.fixture(scope="module")
+def _vec_param(vec) -> str:
+    """Compact vector literal for TO_VECTOR binding (no JSON whitespace)."""
+    return "[" + ",".join(map(str, vec)) + "]"
+
+
+@pytest.fixture(scope="session")
 def iris_engine(iris_connection):
     """Return an IRISGraphEngine instance built on the shared iris_connection."""
     from iris_vector_graph.engine import IRISGraphEngine
     engine = IRISGraphEngine(iris_connection, embedding_dimension=DIM)
 
-    # Ensure schema exists
+    # Ensure schema and the HNSW index on kg_NodeEmbeddings exist in one bootstrap
     try:
-        engine.initialize_schema()
+        engine.initialize_schema(create_vector_indexes=True)
     except Exception:
         pass
 
     yield engine
 
-@pytest.fixture(scope="module")
-def vector_test_nodes(iris_engine):
+@pytest.fixture(scope="session")
+def vector_test_nodes(iris_engine, _schema_ok):
     """Seed Gene and Drug nodes with 3-d embeddings for e2e vector search tests.
 
     gene-a: [1.0, 0.0, 0.0]  — most similar to query [1,0,0]
@@ -75,66 +79,36 @@ def vector_test_nodes(iris_engine):
 
     from iris_vector_graph.cypher.translator import _table
 
-    try:
-        for node_id, label, vec in nodes:
-            try:
-                cursor.execute(
-                    f"INSERT INTO {_table('nodes')} (node_id) VALUES (?)", [node_id]
-                )
-            except Exception:
-                pass
-            try:
-                cursor.execute(
-                    f"INSERT INTO {_table('rdf_labels')} (s, label) VALUES (?, ?)",
-                    [node_id, label],
-                )
-            except Exception:
-                pass
-            vec_json = json.dumps(vec)
-            try:
-                # NOTE: kg_NodeEmbeddings uses 'id' as PK column (not 'node_id')
-                cursor.execute(
-                    f"INSERT INTO {_table('kg_NodeEmbeddings')} (id, emb) "
-                    f"SELECT ?, TO_VECTOR(?) WHERE NOT EXISTS "
-                    f"(SELECT 1 FROM {_table('kg_NodeEmbeddings')} WHERE id = ?)",
-                    [node_id, vec_json, node_id],
-                )
-            except Exception:
-                pass
-        conn.commit()
-    except Exception:
-        try:
-            conn.rollback()
-        except Exception:
-            pass
+    # Resolve table names once; the session-long cleanup must hit the same tables
+    # even if another module changes the global schema prefix in between.
+    t_nodes, t_labels, t_emb = _table("nodes"), _table("rdf_labels"), _table("kg_NodeEmbeddings")
+    # One executemany per table. IRIS has no ANSI MERGE; INSERT OR UPDATE is its
+    # keyed upsert (single PK probe per row), so re-runs stay idempotent.
+    # NOTE: kg_NodeEmbeddings uses 'id' as PK column (not 'node_id')
+    insert_node = f"INSERT OR UPDATE INTO {t_nodes} (node_id) VALUES (?)"
+    insert_label = f"INSERT OR UPDATE INTO {t_labels} (s, label) VALUES (?, ?)"
+    # Typed, dimensioned TO_VECTOR with compact text, as dbapi_utils.insert_vector does.
+    insert_emb = f"INSERT OR UPDATE INTO {t_emb} (id, emb) VALUES (?, TO_VECTOR(?, DOUBLE, {DIM}))"
+    delete_emb = f"DELETE FROM {t_emb} WHERE id = ?"
+    delete_label = f"DELETE FROM {t_labels} WHERE s = ?"
+    delete_node = f"DELETE FROM {t_nodes} WHERE node_id = ?"
 
-    # Create HNSW index (idempotent — ignore if already exists)
     try:
-        cursor.execute(
-            f"CREATE INDEX ivg_e2e_vs_hnsw ON {_table('kg_NodeEmbeddings')} (emb) USING HNSW"
-        )
+        cursor.executemany(insert_node, [[node_id] for node_id, _, _ in nodes])
+        cursor.executemany(insert_label, [[node_id, label] for node_id, label, _ in nodes])
+        cursor.executemany(insert_emb, [[node_id, _vec_param(vec)] for node_id, _, vec in nodes])
         conn.commit()
     except Exception:
-        try:
-            conn.rollback()
-        except Exception:
-            pass
+        conn.rollback()
+        raise
 
     yield nodes
 
     # Cleanup
-    node_ids = [n[0] for n in nodes]
+    node_ids = [[n[0]] for n in nodes]
     try:
-        for node_id in node_ids:
-            cursor.execute(
-                f"DELETE FROM {_table('kg_NodeEmbeddings')} WHERE id = ?", [node_id]
-            )
-            cursor.execute(
-                f"DELETE FROM {_table('rdf_labels')} WHERE s = ?", [node_id]
-            )
-            cursor.execute(
-                f"DELETE FROM {_table('nodes')} WHERE node_id = ?", [node_id]
-            )
+        for sql in (delete_emb, delete_label, delete_node):
+            cursor.executemany(sql, node_ids)
         conn.commit()
     except Exception:
         try:
@@ -143,6 +117,16 @@ def vector_test_nodes(iris_engine):
             pass
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _vector_search_warmup(iris_engine, vector_test_nodes):
+    """Run one throwaway search so timed tests see a compiled statement and paged-in HNSW."""
+    q = "[" + ", ".join(str(v) for v in VEC_QUERY) + "]"
+    iris_engine.execute_cypher(
+        f"CALL ivg.vector.search('Gene', 'embedding', {q}, 3) "
+        "YIELD node, score RETURN node, score"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
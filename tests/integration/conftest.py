@@ -1,6 +1,8 @@
+import json
 import pytest
 import os
 import uuid
+from iris_vector_graph.cypher import translator as _translator
 from iris_vector_graph.cypher.parser import parse_query
 from iris_vector_graph.cypher.translator import translate_to_sql
 from iris_vector_graph.engine import IRISGraphEngine
@@ -102,16 +104,39 @@ def fraud_test_data(iris_connection):
         iris_connection.rollback()
 
 
+# (query, params JSON, schema prefix) -> translated read-only query
+_translation_cache = {}
+
+
+def _translate(query, params=None):
+    """Translate Cypher, reusing earlier translations of the same read-only query.
+
+    Writes are never cached: CREATE without an explicit id gets a fresh uuid4
+    node id at translation time, so a reused translation would insert the same
+    id again.
+    """
+    try:
+        key = (
+            query,
+            json.dumps(params, sort_keys=True) if params is not None else None,
+            _translator._schema_prefix,
+        )
+    except TypeError:
+        return translate_to_sql(parse_query(query), params=params)
+    sql_query = _translation_cache.get(key)
+    if sql_query is None:
+        sql_query = translate_to_sql(parse_query(query), params=params)
+        if not sql_query.is_transactional:
+            _translation_cache[key] = sql_query
+    return sql_query
+
+
 @pytest.fixture
 def execute_cypher(fraud_test_data):
     conn = fraud_test_data["conn"]
 
     def _execute(query, params=None):
-        from iris_vector_graph.cypher.parser import parse_query
-        from iris_vector_graph.cypher.translator import translate_to_sql
-
-        ast = parse_query(query)
-        sql_query = translate_to_sql(ast, params=params)
+        sql_query = _translate(query, params)
 
         cursor = conn.cursor()
 
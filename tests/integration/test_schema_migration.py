@@ -28,25 +28,41 @@ def clean_schema(iris_connection):
 
     yield iris_connection
 
-    # Teardown: clean up what the test created (only reached if not skipped)
+    # Teardown: clean up what the test created (only reached if not skipped).
+    _drop_graph_schema(iris_connection, cursor)
+
+
+# FK-safe order for the fallback when DROP SCHEMA ... CASCADE is unsupported
+_FALLBACK_DROPS = tuple(
+    f"DROP TABLE IF EXISTS Graph_KG.{tbl}"
     for tbl in (
         "kg_NodeEmbeddings_optimized", "kg_NodeEmbeddings",
         "rdf_edges", "rdf_props", "rdf_labels", "docs", "nodes",
-    ):
+    )
+) + ("DROP SCHEMA Graph_KG",)
+
+
+def _drop_graph_schema(conn, cursor):
+    """Drop Graph_KG in one CASCADE statement, else table by table with a single commit."""
+    try:
+        cursor.execute("DROP SCHEMA Graph_KG CASCADE")
+        conn.commit()
+        return
+    except Exception:
         try:
-            cursor.execute(f"DROP TABLE Graph_KG.{tbl}")
-            iris_connection.commit()
+            conn.rollback()
         except Exception:
-            try:
-                iris_connection.rollback()
-            except Exception:
-                pass
+            pass
+    for stmt in _FALLBACK_DROPS:
+        try:
+            cursor.execute(stmt)
+        except Exception:
+            pass
     try:
-        cursor.execute("DROP SCHEMA Graph_KG")
-        iris_connection.commit()
+        conn.commit()
     except Exception:
         try:
-            iris_connection.rollback()
+            conn.rollback()
         except Exception:
             pass
 
@@ -0,0 +1,81 @@
+"""Timing helpers shared by the performance benchmarks.
+
+All timings use ``time.perf_counter`` (monotonic, high resolution) rather
+than ``time.time``, whose wall-clock adjustments add jitter to short runs.
+"""
+
+import statistics
+from itertools import islice
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List
+
+
+class Timer:
+    """Context manager recording the elapsed seconds of its block in ``elapsed``."""
+
+    __slots__ = ("t0", "elapsed")
+
+    def __enter__(self):
+        self.t0 = perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self.elapsed = perf_counter() - self.t0
+
+
+def summarize(times_s: List[float]) -> Dict[str, float]:
+    """Reduce per-run seconds to min/p50/p95/max/mean in milliseconds.
+
+    p95 falls back to the max below 20 samples, where a percentile would
+    just be the largest value anyway.
+    """
+    ms = sorted(t * 1000 for t in times_s)
+    return {
+        "min": ms[0],
+        "p50": statistics.median(ms),
+        "p95": ms[int(len(ms) * 0.95)] if len(ms) >= 20 else ms[-1],
+        "max": ms[-1],
+        "mean": statistics.mean(ms),
+    }
+
+
+def bench(fn: Callable[[], object], runs: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Call `fn` `warmup` times untimed, then `runs` times; return ``summarize`` of the runs.
+
+    Prefer ``min``/``p50`` for latency and ``p95`` for thresholds: GC pauses
+    and scheduler hiccups only ever add time, so a plain mean over a handful
+    of runs is dominated by whichever run hit one.
+    """
+    for _ in range(warmup):
+        fn()
+    ts = []
+    for _ in range(runs):
+        with Timer() as t:
+            fn()
+        ts.append(t.elapsed)
+    return summarize(ts)
+
+
+def iter_batches(rows: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of at most `size` items from `rows` without materialising the whole stream."""
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def enable_bulk_mode(cursor, arraysize: int = 5000):
+    """Turn on driver-side bulk binding where the DB-API driver offers it.
+
+    pyodbc-style drivers only pack executemany rows into one packet when
+    ``fast_executemany`` is set; the IRIS DB-API batches executemany already
+    and has no such switch, so this is a no-op there apart from ``arraysize``
+    (the default fetchmany size). Returns the cursor for chaining.
+    """
+    if hasattr(cursor, "fast_executemany"):
+        cursor.fast_executemany = True
+    if hasattr(cursor, "arraysize"):
+        cursor.arraysize = arraysize
+    return cursor
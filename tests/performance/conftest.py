@@ -1,16 +1,99 @@
-import pytest
 import os
+
 import iris
+import pytest
+
 
 @pytest.fixture(scope="session")
 def iris_connection():
-    """Establish connection to IRIS for performance tests using DB-API"""
+    """Dedicated IRIS connection for performance tests using DB-API.
+
+    Always connects from IRIS_HOST/IRIS_PORT/... rather than reusing the
+    managed test-container connection: graph_schema drops and recreates the
+    Graph_KG tables, which must never happen on the shared test database.
+    """
     host = os.getenv("IRIS_HOST", "localhost")
     port = int(os.getenv("IRIS_PORT", 1981))
     namespace = os.getenv("IRIS_NAMESPACE", "USER")
     username = os.getenv("IRIS_USERNAME", "_SYSTEM")
     password = os.getenv("IRIS_PASSWORD", "SYS")
-    
+
     conn = iris.connect(f"{host}:{port}/{namespace}", username, password)
     yield conn
     conn.close()
+
+
+_GRAPH_TABLES = [
+    "Graph_KG.kg_NodeEmbeddings_optimized",
+    "Graph_KG.kg_NodeEmbeddings",
+    "Graph_KG.docs",
+    "Graph_KG.rdf_edges",
+    "Graph_KG.rdf_props",
+    "Graph_KG.rdf_labels",
+    "Graph_KG.nodes",
+]
+
+# (table, id column) in FK-safe delete order
+_BENCH_ROWS = [
+    ("Graph_KG.kg_NodeEmbeddings", "id"),
+    ("Graph_KG.rdf_edges", "s"),
+    ("Graph_KG.rdf_props", "s"),
+    ("Graph_KG.rdf_labels", "s"),
+    ("Graph_KG.nodes", "node_id"),
+]
+
+BENCH_PREFIXES = ("n:", "node:", "BENCH:")
+
+
+@pytest.fixture(scope="session")
+def graph_schema(iris_connection):
+    """Drop and recreate the Graph_KG tables once for the whole performance session.
+
+    Runs on the dedicated perf connection only. Tables are left in place at
+    session end; clean_bench_data removes the benchmark rows.
+    """
+    from iris_vector_graph.cypher import set_schema_prefix
+    from iris_vector_graph.schema import GraphSchema
+    from iris_vector_graph.utils import _split_sql_statements
+
+    conn = iris_connection
+    cursor = conn.cursor()
+    try:
+        cursor.execute("CREATE SCHEMA Graph_KG")
+    except Exception:
+        pass
+    try:
+        cursor.execute("SET OPTION DEFAULT_SCHEMA = Graph_KG")
+    except Exception:
+        pass
+
+    for table in _GRAPH_TABLES:
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        except Exception as e:
+            print(f"Drop warning: {e}")
+
+    for stmt in _split_sql_statements(GraphSchema.get_base_schema_sql()):
+        if stmt.strip():
+            cursor.execute(stmt)
+    GraphSchema.ensure_indexes(cursor)
+    conn.commit()
+    set_schema_prefix("Graph_KG")
+
+    yield conn
+
+
+def _delete_bench_rows(conn):
+    cursor = conn.cursor()
+    for table, col in _BENCH_ROWS:
+        for prefix in BENCH_PREFIXES:
+            cursor.execute(f"DELETE FROM {table} WHERE {col} %STARTSWITH ?", [prefix])
+    conn.commit()
+
+
+@pytest.fixture(scope="function")
+def clean_bench_data(graph_schema):
+    """Wipe benchmark rows (not the schema) before and after each test."""
+    _delete_bench_rows(graph_schema)
+    yield graph_schema
+    _delete_bench_rows(graph_schema)
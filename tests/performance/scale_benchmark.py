@@ -8,85 +8,141 @@ Focuses on:
 """
 
 import time
-import json
 import random
 import argparse
-from typing import List, Dict, Any
 from iris_devtester.utils.dbapi_compat import get_connection as iris_connect
 from iris_vector_graph.engine import IRISGraphEngine
 from iris_vector_graph.schema import GraphSchema
 
+try:
+    from tests.performance.bench_utils import Timer, bench, enable_bulk_mode
+except ImportError:  # run as a script from tests/performance
+    from bench_utils import Timer, bench, enable_bulk_mode
+
 class PerformanceBenchmark:
     def __init__(self, entities: int = 10000):
         self.entities_count = entities
         self.conn = self._setup_connection()
+        # One cursor shared by every benchmark phase; the driver's statement
+        # cache lives on it, so repeated SQL text is prepared once.
+        self.cursor = enable_bulk_mode(self.conn.cursor())
         self.engine = IRISGraphEngine(self.conn)
         self.node_ids = [f"BENCH:NODE:{i}" for i in range(entities)]
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        try:
+            self.cursor.close()
+        finally:
+            self.conn.close()
+
     def _setup_connection(self):
         return iris_connect("localhost", 1972, "USER", "_SYSTEM", "SYS")
 
-    def setup_data(self):
+    def setup_data(self, reuse_schema: bool = False):
         print(f"--- Setting up {self.entities_count} entities ---")
-        cursor = self.conn.cursor()
-        
-        # Clean up old bench data - reverse order for FKs
+        cursor = self.cursor
+
+        if reuse_schema:
+            cursor.execute("SELECT COUNT(*) FROM Graph_KG.nodes WHERE node_id %STARTSWITH 'BENCH:NODE:'")
+            if cursor.fetchone()[0] == self.entities_count:
+                print("Reusing existing bench data (--reuse-schema)")
+                return
+
+        # Clean up old bench data - reverse order for FKs, one commit for all three
         cursor.execute("DELETE FROM Graph_KG.rdf_props WHERE s LIKE 'BENCH:%'")
         cursor.execute("DELETE FROM Graph_KG.rdf_labels WHERE s LIKE 'BENCH:%'")
         cursor.execute("DELETE FROM Graph_KG.nodes WHERE node_id LIKE 'BENCH:%'")
         self.conn.commit()
         
-        # Bulk load data
-        nodes = []
-        for i in range(self.entities_count):
-            nodes.append({
-                "id": self.node_ids[i],
-                "labels": ["Benchmark", "TestNode"],
+        # Bulk load data. Loop-invariant values are built once: the label list is
+        # shared (bulk_create_nodes only reads it) and the per-i strings come
+        # from %-templates rather than re-parsed f-strings.
+        labels = ["Benchmark", "TestNode"]
+        tag_digits = [str(d) for d in range(10)]
+        desc_tmpl = "This is a long description for node %d to test substring indexing capabilities in IRIS."
+        rand = random.random
+        nodes = [
+            {
+                "id": node_id,
+                "labels": labels,
                 "properties": {
-                    "name": f"Node Name {i}",
-                    "description": f"This is a long description for node {i} to test substring indexing capabilities in IRIS.",
+                    "name": "Node Name %d" % i,
+                    "description": desc_tmpl % i,
                     "counter": i,
-                    "metadata": {"tags": ["bench", str(i % 10)], "score": random.random()}
-                }
-            })
+                    "metadata": {"tags": ["bench", tag_digits[i % 10]], "score": rand()},
+                },
+            }
+            for i, node_id in enumerate(self.node_ids)
+        ]
         
-        start = time.time()
-        self.engine.bulk_create_nodes(nodes)
-        end = time.time()
-        print(f"Bulk load completed in {end - start:.2f}s ({self.entities_count / (end - start):.0f} nodes/sec)")
+        # Skip per-row index maintenance during the load; rebuild once afterwards,
+        # even if the load fails, so the database never keeps dropped indexes.
+        with Timer() as t:
+            GraphSchema.disable_indexes(cursor)
+            try:
+                self.engine.bulk_create_nodes(nodes)
+            finally:
+                GraphSchema.rebuild_indexes(cursor)
+            self.conn.commit()
+        print(f"Bulk load completed in {t.elapsed:.2f}s ({self.entities_count / t.elapsed:.0f} nodes/sec)")
 
     def test_get_nodes_performance(self):
         print("\n--- Benchmarking get_nodes() ---")
         
         batch_sizes = [1, 10, 100, 1000]
-        for size in batch_sizes:
-            # Pick random nodes
-            sample_ids = random.sample(self.node_ids, size)
-            
-            start = time.time()
+        runs = 5
+        # Draw every sample up front (seeded) so no allocation or RNG work
+        # happens between timed calls.
+        rng = random.Random(42)
+        samples = {size: rng.sample(self.node_ids, size) for size in batch_sizes}
+        for size, sample_ids in samples.items():
+            # Untimed correctness call doubles as the warm-up
             nodes = self.engine.get_nodes(sample_ids)
-            end = time.time()
-            
-            lat = (end - start) * 1000
-            print(f"Batch size {size:4d}: {lat:7.2f}ms (total) | {lat/size:7.2f}ms (per node)")
             assert len(nodes) == size
+            stats = bench(lambda: self.engine.get_nodes(sample_ids), runs=runs, warmup=0)
+            print(
+                f"Batch size {size:4d}: min {stats['min']:7.2f}ms | p50 {stats['p50']:7.2f}ms (total) | "
+                f"{stats['p50'] / size:7.2f}ms (per node)"
+            )
 
     def test_substring_search(self):
         print("\n--- Benchmarking Substring Search (CONTAINS) ---")
         
         # We'll use direct SQL to measure CONTAINS performance
         # Since Cypher translation might add overhead, we want to see the DB performance
-        cursor = self.conn.cursor()
+        cursor = self.cursor
         
         search_terms = ["Node Name 500", "description for node 99", "indexing capabilities"]
-        
+
+        # One scan of rdf_props answers every term instead of one LIKE scan per term
+        sums = ", ".join("SUM(CASE WHEN val LIKE ? THEN 1 ELSE 0 END)" for _ in search_terms)
+        patterns = [f"%{term}%" for term in search_terms]
+        with Timer() as t:
+            cursor.execute(f"SELECT {sums} FROM Graph_KG.rdf_props", patterns)
+            counts = cursor.fetchone()
+        total_ms = t.elapsed * 1000
+        per_term_ms = total_ms / len(search_terms)
+
+        for term, count in zip(search_terms, counts):
+            print(f"LIKE   '{term}': {count or 0} matches | {per_term_ms:.2f}ms (amortized)")
+
+        # Same terms through the iFind index created by GraphSchema.ensure_indexes
         for term in search_terms:
-            start = time.time()
-            cursor.execute("SELECT COUNT(*) FROM Graph_KG.rdf_props WHERE val LIKE ?", [f"%{term}%"])
-            count = cursor.fetchone()[0]
-            end = time.time()
-            
-            print(f"Search for '{term}': {count} matches | {(end - start) * 1000:.2f}ms")
+            try:
+                with Timer() as t:
+                    cursor.execute(
+                        "SELECT COUNT(*) FROM Graph_KG.rdf_props "
+                        "WHERE %ID %FIND search_index(idx_props_val_ifind, ?)",
+                        [term],
+                    )
+                    count = cursor.fetchone()[0]
+            except Exception as e:
+                print(f"iFind  unavailable ({e}); skipping index comparison")
+                break
+            print(f"iFind  '{term}': {count} matches | {t.elapsed * 1000:.2f}ms")
 
     def test_mutation_latency(self):
         print("\n--- Benchmarking Single Node Creation (Transactional) ---")
@@ -96,21 +152,20 @@ class PerformanceBenchmark:
         props = {"timestamp": time.time(), "msg": "hello"}
         
         # Cleanup
-        cursor = self.conn.cursor()
+        cursor = self.cursor
         cursor.execute("DELETE FROM Graph_KG.nodes WHERE node_id = ?", [node_id])
         self.conn.commit()
         
-        start = time.time()
-        success = self.engine.create_node(node_id, labels, props)
-        end = time.time()
+        with Timer() as t:
+            success = self.engine.create_node(node_id, labels, props)
         
         if success:
-            print(f"create_node latency: {(end - start) * 1000:.2f}ms")
+            print(f"create_node latency: {t.elapsed * 1000:.2f}ms")
         else:
             print("create_node failed")
 
-    def run_all(self):
-        self.setup_data()
+    def run_all(self, reuse_schema: bool = False):
+        self.setup_data(reuse_schema=reuse_schema)
         self.test_get_nodes_performance()
         self.test_substring_search()
         self.test_mutation_latency()
@@ -118,7 +173,9 @@ class PerformanceBenchmark:
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--entities", type=int, default=10000)
+    parser.add_argument("--reuse-schema", action="store_true",
+                        help="Skip the reload when bench data from a previous run is present")
     args = parser.parse_args()
     
-    bench = PerformanceBenchmark(entities=args.entities)
-    bench.run_all()
+    with PerformanceBenchmark(entities=args.entities) as benchmark:
+        benchmark.run_all(reuse_schema=args.reuse_schema)
@@ -1,48 +1,57 @@
-import time
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+
 import pytest
-import iris
 from iris_vector_graph import IRISGraphEngine
-from iris_vector_graph.schema import GraphSchema
 from iris_vector_graph.cypher import set_schema_prefix
+from tests._iris_pool import open_sibling
+from tests.performance.bench_utils import Timer, bench, enable_bulk_mode, iter_batches, summarize
+
+logger = logging.getLogger(__name__)
+
+# Session + lazy native connection + workers must fit the CE 5-connection cap
+PPR_WORKERS = 3
+
+
+def _run_ppr_parallel(conn, runs, **ppr_kwargs):
+    """Run `runs` PPR queries on worker connections; returns (per-query seconds, wall seconds)."""
+    def one_run(_):
+        c = open_sibling(conn)
+        try:
+            e = IRISGraphEngine(c)
+            with Timer() as t:
+                scores = e.kg_PERSONALIZED_PAGERANK(**ppr_kwargs)
+        finally:
+            c.close()
+        assert len(scores) > 0
+        return t.elapsed
+
+    with Timer() as wall:
+        with ThreadPoolExecutor(max_workers=min(PPR_WORKERS, runs)) as ex:
+            times = list(ex.map(one_run, range(runs)))
+    return times, wall.elapsed
+
 
 @pytest.mark.performance
 @pytest.mark.xfail(reason="License exhaustion under concurrent container load; pre-existing environment constraint")
-def test_ppr_stress_scale(iris_connection):
+def test_ppr_stress_scale(clean_bench_data, request):
     """
     Robust stress test for Personalized PageRank (PPR) at scale.
     Target: 10,000 nodes, 50,000 edges.
+
+    With ``--parallel`` the timed runs are spread over concurrent connections;
+    the latency assertions still use per-query time, not throughput. 20 runs
+    per mode give a meaningful p95; stats are printed as JSON for CI.
     """
-    conn = iris_connection
-    cursor = conn.cursor()
+    conn = clean_bench_data
+    cursor = enable_bulk_mode(conn.cursor())
     
     print("\n--- Starting PPR E2E Stress Test (Robust) ---")
     
-    # 1. Setup Schema
-    print("Setting up Graph_KG Schema...")
-    try: cursor.execute("CREATE SCHEMA Graph_KG")
-    except: pass
-    
-    try: cursor.execute("SET OPTION DEFAULT_SCHEMA = Graph_KG")
-    except: pass
-    
-    tables = [
-        "Graph_KG.kg_NodeEmbeddings_optimized",
-        "Graph_KG.kg_NodeEmbeddings",
-        "Graph_KG.docs",
-        "Graph_KG.rdf_edges",
-        "Graph_KG.rdf_props",
-        "Graph_KG.rdf_labels",
-        "Graph_KG.nodes"
-    ]
-    for table in tables:
-        try: cursor.execute(f"DROP TABLE IF EXISTS {table}")
-        except Exception as e: print(f"Drop warning: {e}")
-    
-    from iris_vector_graph.utils import _split_sql_statements
-    for stmt in _split_sql_statements(GraphSchema.get_base_schema_sql()):
-        if stmt.strip(): cursor.execute(stmt)
-            
-    GraphSchema.ensure_indexes(cursor)
+    # 1. Schema is created once per session by graph_schema; rows are
+    #    wiped per test by clean_bench_data.
     set_schema_prefix('Graph_KG')
     
     engine = IRISGraphEngine(conn)
@@ -52,64 +61,78 @@ def test_ppr_stress_scale(iris_connection):
     edges_per_node = 5
     print(f"Loading {node_count} nodes and {node_count * edges_per_node} edges...")
     
-    start_load = time.time()
-    
-    # Simple loop for reliability in stress test
-    node_sql = "INSERT INTO Graph_KG.nodes (node_id) VALUES (?)"
-    edge_sql = "INSERT INTO Graph_KG.rdf_edges (s, p, o_id) VALUES (?, ?, ?)"
-    
-    for i in range(node_count):
-        node_id = f"n:{i}"
-        cursor.execute(node_sql, [node_id])
-        
-    for i in range(node_count):
-        for j in range(1, edges_per_node + 1):
-            target = (i + j) % node_count
-            cursor.execute(edge_sql, [f"n:{i}", "LINKED_TO", f"n:{target}"])
-            
-        if i % 2000 == 0 and i > 0:
-            print(f"  ...loaded {i} node edges")
-            conn.commit()
-            
-    conn.commit()
-    print(f"Load complete in {time.time() - start_load:.2f}s")
+    with Timer() as load_timer:
+        # Batched executemany: one round trip per BATCH rows instead of per row
+        node_sql = "INSERT INTO Graph_KG.nodes (node_id) VALUES (?)"
+        edge_sql = "INSERT INTO Graph_KG.rdf_edges (s, p, o_id) VALUES (?, ?, ?)"
+        BATCH = 10000
+
+        # Same SQL text on one cursor for every chunk: parsed once, then the
+        # driver's cached statement is reused for the remaining batches.
+        node_ids = [f"n:{i}" for i in range(node_count)]
+        # Edges are streamed in BATCH-sized lists rather than materialised as one
+        # 50K-row list. Target (i + j) % node_count is the id list rotated by j,
+        # so each offset is a single zip with no per-edge modulo or indexing.
+        edges = chain.from_iterable(
+            zip(node_ids, repeat("LINKED_TO"), node_ids[j:] + node_ids[:j])
+            for j in range(1, edges_per_node + 1)
+        )
+        for batch in iter_batches(((nid,) for nid in node_ids), BATCH):
+            cursor.executemany(node_sql, batch)
+        loaded = 0
+        for batch in iter_batches(edges, BATCH):
+            cursor.executemany(edge_sql, batch)
+            loaded += len(batch)
+            logger.info("loaded %d edges (uncommitted)", loaded)
+
+        # Single commit for the whole load; the graph is rebuilt per test, so
+        # intermediate commits would only add journal flushes.
+        conn.commit()
+    print(f"Load complete in {load_timer.elapsed:.2f}s")
     
     # 3. Benchmark PPR
     print("\nBenchmarking Personalized PageRank (Forward)...")
     # Warm up
     engine.kg_PERSONALIZED_PAGERANK(seed_entities=["n:0"], max_iterations=5)
     
-    runs = 5
-    total_time = 0
-    for i in range(runs):
-        start_q = time.time()
+    runs = 20
+    if request.config.getoption("--parallel"):
+        fwd = dict(seed_entities=["n:0"], damping_factor=0.85, max_iterations=20, return_top_k=10)
+        bi = dict(seed_entities=["n:0"], bidirectional=True, max_iterations=20, return_top_k=10)
+        times, wall = _run_ppr_parallel(conn, runs, **fwd)
+        stats = summarize(times)
+        print(f"PPR Latency (Forward, ms): {json.dumps(stats)} | wall {wall * 1000:.2f}ms for {runs} runs")
+        times_bi, wall_bi = _run_ppr_parallel(conn, runs, **bi)
+        print(f"PPR Latency (Bidirectional, ms): {json.dumps(summarize(times_bi))} | wall {wall_bi * 1000:.2f}ms for {runs} runs")
+        assert stats["p95"] < 250 and stats["min"] < 100, f"PPR too slow: {stats}"
+        return
+
+    def forward():
         scores = engine.kg_PERSONALIZED_PAGERANK(
             seed_entities=["n:0"],
             damping_factor=0.85,
             max_iterations=20,
             return_top_k=10
         )
-        total_time += (time.time() - start_q)
         assert len(scores) > 0
-        
-    avg_ms = (total_time / runs) * 1000
-    print(f"Average PPR Latency (Forward): {avg_ms:.2f}ms")
+
+    # Warm-up already ran above with max_iterations=5
+    stats = bench(forward, runs=runs, warmup=0)
+    print(f"PPR Latency (Forward, ms): {json.dumps(stats)}")
     
     # 4. Benchmark Bidirectional PPR
     print("Benchmarking Personalized PageRank (Bidirectional)...")
-    total_time_bi = 0
-    for i in range(runs):
-        start_q = time.time()
-        scores = engine.kg_PERSONALIZED_PAGERANK(
+
+    def bidirectional():
+        engine.kg_PERSONALIZED_PAGERANK(
             seed_entities=["n:0"],
             bidirectional=True,
             max_iterations=20,
             return_top_k=10
         )
-        total_time_bi += (time.time() - start_q)
-        
-    avg_ms_bi = (total_time_bi / runs) * 1000
-    print(f"Average PPR Latency (Bidirectional): {avg_ms_bi:.2f}ms")
+
+    stats_bi = bench(bidirectional, runs=runs, warmup=0)
+    print(f"PPR Latency (Bidirectional, ms): {json.dumps(stats_bi)}")
     
     print("\n--- PPR Stress Test Passed ---")
-    assert avg_ms < 200, f"PPR too slow: {avg_ms}ms"
+    assert stats["p95"] < 250 and stats["min"] < 100, f"PPR too slow: {stats}"
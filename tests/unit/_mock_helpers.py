@@ -0,0 +1,82 @@
+"""Lightweight DB-API stand-ins for unit tests that only record SQL.
+
+MagicMock records every call through child mocks and ``call_args_list``
+machinery; these stubs append ``(sql, params)`` tuples to plain lists, so
+tests that push large batches through the engine stay cheap and assertions
+iterate ordinary Python lists.
+"""
+
+
+class FastCursor:
+    __slots__ = ("executed", "executed_many")
+
+    description = None
+
+    def __init__(self):
+        self.executed = []
+        self.executed_many = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def executemany(self, sql, rows):
+        self.executed_many.append((sql, list(rows)))
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return []
+
+    def fetchmany(self, size=1):
+        return []
+
+    def close(self):
+        pass
+
+
+class ScriptedCursor(FastCursor):
+    """FastCursor whose execute() steps through ``results``, one row list per statement.
+
+    Statements run once the script is exhausted see an empty result set.
+    """
+
+    __slots__ = ("results", "_current")
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+        self._current = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+        self._current = list(self.results.pop(0)) if self.results else []
+
+    def fetchone(self):
+        return self._current.pop(0) if self._current else None
+
+    def fetchall(self):
+        rows, self._current = self._current, []
+        return rows
+
+    def fetchmany(self, size=1):
+        rows = self._current[:size]
+        del self._current[:size]
+        return rows
+
+
+class FastConn:
+    __slots__ = ("cur", "commits")
+
+    def __init__(self, cursor_cls=FastCursor):
+        self.cur = cursor_cls()
+        self.commits = 0
+
+    def cursor(self):
+        return self.cur
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
@@ -1,21 +1,17 @@
 import pytest
-import json
-from unittest.mock import MagicMock, patch
 from iris_vector_graph.engine import IRISGraphEngine
+from tests.unit._mock_helpers import FastConn, FastCursor
 
 @pytest.fixture
 def mock_conn():
-    conn = MagicMock()
-    cursor = MagicMock()
-    conn.cursor.return_value = cursor
-    return conn
+    return FastConn()
 
 @pytest.fixture
 def engine(mock_conn):
     return IRISGraphEngine(mock_conn)
 
 def test_create_node_transactional(engine, mock_conn):
-    cursor = mock_conn.cursor.return_value
+    cursor = mock_conn.cur
     
     node_id = "test-node"
     labels = ["L1", "L2"]
@@ -25,31 +21,39 @@ def test_create_node_transactional(engine, mock_conn):
     
     assert success is True
     # Verify transaction boundaries
-    cursor.execute.assert_any_call("START TRANSACTION")
-    cursor.execute.assert_any_call("COMMIT")
+    executed_sql = [sql for sql, _ in cursor.executed]
+    assert "START TRANSACTION" in executed_sql
+    assert "COMMIT" in executed_sql
     
     # Verify inserts
     # Node insert
-    assert any("INSERT INTO" in call[0][0] and "nodes" in call[0][0] for call in cursor.execute.call_args_list)
+    assert any("INSERT INTO" in sql and "nodes" in sql for sql in executed_sql)
     
     # Labels and props batch inserts
-    assert cursor.executemany.call_count == 2
+    assert len(cursor.executed_many) == 2
     
     # Labels verify
-    label_call = next(c for c in cursor.executemany.call_args_list if "rdf_labels" in c[0][0])
-    assert label_call[0][1] == [["test-node", "L1"], ["test-node", "L2"]]
+    label_rows = next(rows for sql, rows in cursor.executed_many if "rdf_labels" in sql)
+    assert label_rows == [["test-node", "L1"], ["test-node", "L2"]]
     
     # Props verify — 3 rows: 'name', 'val', plus auto-injected 'id'
-    prop_call = next(c for c in cursor.executemany.call_args_list if "rdf_props" in c[0][0])
-    prop_keys = [row[1] for row in prop_call[0][1]]
-    assert len(prop_call[0][1]) == 3
+    prop_rows = next(rows for sql, rows in cursor.executed_many if "rdf_props" in sql)
+    prop_keys = [row[1] for row in prop_rows]
+    assert len(prop_rows) == 3
     assert "id" in prop_keys, "create_node must store 'id' in rdf_props for Cypher queryability"
     assert "name" in prop_keys
     assert "val" in prop_keys
 
-def test_create_node_rollback_on_failure(engine, mock_conn):
-    cursor = mock_conn.cursor.return_value
-    cursor.executemany.side_effect = Exception("DB Error")
+class _FailingCursor(FastCursor):
+    __slots__ = ()
+
+    def executemany(self, sql, rows):
+        raise Exception("DB Error")
+
+def test_create_node_rollback_on_failure():
+    conn = FastConn(cursor_cls=_FailingCursor)
+    engine = IRISGraphEngine(conn)
+    cursor = conn.cur
     
     node_id = "test-node"
     labels = ["L1"]
@@ -57,10 +61,10 @@ def test_create_node_rollback_on_failure(engine, mock_conn):
     success = engine.create_node(node_id, labels, {})
     
     assert success is False
-    cursor.execute.assert_any_call("ROLLBACK")
+    assert ("ROLLBACK", None) in cursor.executed
 
 def test_bulk_create_nodes_batching(engine, mock_conn):
-    cursor = mock_conn.cursor.return_value
+    cursor = mock_conn.cur
     
     nodes = [
         {"id": "n1", "labels": ["A"], "properties": {"p": 1}},
@@ -72,5 +76,5 @@ def test_bulk_create_nodes_batching(engine, mock_conn):
     assert result == ["n1", "n2"]
     # Check executemany for nodes, labels, and props
     # bulk_create_nodes uses 3 executemany calls
-    assert cursor.executemany.call_count == 3
-    mock_conn.commit.assert_called()
+    assert len(cursor.executed_many) == 3
+    assert mock_conn.commits >= 1
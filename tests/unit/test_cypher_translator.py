@@ -250,3 +250,17 @@ def test_gqs_oracle_pattern_parses():
     q = "MATCH (a)-[r]-(b) WHERE a.id = 1 RETURN count(*) MATCH (a)-[r2]-(b) WHERE a.id = 1 RETURN DISTINCT b.id"
     parsed = parse_query(q)
     assert len(parsed.subsequent_queries) >= 1
+
+def test_deeply_nested_and_chain_translates_without_recursion():
+    from iris_vector_graph.cypher import ast
+    from iris_vector_graph.cypher.translator import (
+        TranslationContext,
+        translate_boolean_expression,
+    )
+
+    expr = ast.Literal(True)
+    for _ in range(5000):
+        expr = ast.BooleanExpression(ast.BooleanOperator.AND, [expr, ast.Literal(False)])
+    sql = translate_boolean_expression(expr, TranslationContext())
+    assert sql.startswith("(" * 5000 + "(1=1) AND (1=0))")
+    assert sql.count("(1=0)") == 5000
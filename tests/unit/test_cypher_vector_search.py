@@ -102,6 +102,18 @@ class TestParser:
         assert isinstance(vec_arg, Literal)
         assert isinstance(vec_arg.value, list)
 
+    def test_vector_literal_numeric_run_matches_general_path(self):
+        q = parse_query(
+            "CALL ivg.vector.search('Gene', 'emb', [0.5, -2, 3, -0.25, 1 + 1, x, 7], 5) "
+            "YIELD node, score"
+        )
+        items = q.procedure_call.arguments[2].value
+        assert [i.value for i in items[:4]] == [0.5, -2, 3, -0.25]
+        assert all(isinstance(i, Literal) for i in items[:4])
+        assert not isinstance(items[4], Literal)
+        assert isinstance(items[5], Variable)
+        assert items[6].value == 7
+
 
 # ---------------------------------------------------------------------------
 # Translator tests
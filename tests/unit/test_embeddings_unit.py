@@ -266,17 +266,21 @@ class TestStoreEmbeddings:
             {"node_id": "n1", "embedding": [0.1, 0.2, 0.3, 0.4]},
             {"node_id": "n2", "embedding": [0.5, 0.6, 0.7, 0.8]},
         ]
-        with patch.object(eng, "_assert_node_exists"):
+        with patch.object(eng, "_assert_nodes_exist"):
             with patch.object(eng, "_get_embedding_dimension", return_value=4):
                 result = eng.store_embeddings(items)
         assert result is True
+        cursor.executemany.assert_called_once()
+        sql, rows = cursor.executemany.call_args[0]
+        assert "TO_VECTOR(?" in sql
+        assert rows == [("n1", "0.1,0.2,0.3,0.4", None), ("n2", "0.5,0.6,0.7,0.8", None)]
 
     def test_dim_mismatch_raises(self):
         eng, conn, cursor = _make_eng(dim=4)
         items = [
             {"node_id": "n1", "embedding": [0.1, 0.2]},  # only 2 dims
         ]
-        with patch.object(eng, "_assert_node_exists"):
+        with patch.object(eng, "_assert_nodes_exist"):
             with patch.object(eng, "_get_embedding_dimension", return_value=4):
                 with pytest.raises(ValueError, match="dimension mismatch"):
                     eng.store_embeddings(items)
@@ -285,17 +289,39 @@ class TestStoreEmbeddings:
         eng, conn, cursor = _make_eng(dim=4)
         items = [{"node_id": "n1", "embedding": [0.1, 0.2, 0.3, 0.4]}]
 
-        call_count = [0]
-        def execute_side(sql, *args, **kwargs):
-            call_count[0] += 1
-            if "INSERT" in sql.upper():
-                raise RuntimeError("insert blocked")
-        cursor.execute.side_effect = execute_side
+        cursor.executemany.side_effect = RuntimeError("insert blocked")
 
-        with patch.object(eng, "_assert_node_exists"):
+        with patch.object(eng, "_assert_nodes_exist"):
             with patch.object(eng, "_get_embedding_dimension", return_value=4):
                 with pytest.raises(RuntimeError):
                     eng.store_embeddings(items)
+        assert cursor.execute.call_args_list[-1][0][0] == "ROLLBACK"
+
+    def test_node_existence_checked_in_one_query(self):
+        eng, conn, cursor = _make_eng(dim=4)
+        items = [
+            {"node_id": "n1", "embedding": [0.1, 0.2, 0.3, 0.4]},
+            {"node_id": "n2", "embedding": [0.5, 0.6, 0.7, 0.8]},
+            {"node_id": "n1", "embedding": [0.9, 0.9, 0.9, 0.9]},
+        ]
+        cursor.fetchall.return_value = [("n1",), ("n2",)]
+        with patch.object(eng, "_get_embedding_dimension", return_value=4):
+            assert eng.store_embeddings(items) is True
+        selects = [c[0] for c in cursor.execute.call_args_list if "SELECT node_id" in c[0][0]]
+        assert len(selects) == 1
+        assert selects[0][1] == ["n1", "n2"]
+
+    def test_missing_nodes_raise_before_insert(self):
+        eng, conn, cursor = _make_eng(dim=4)
+        items = [
+            {"node_id": "n1", "embedding": [0.1, 0.2, 0.3, 0.4]},
+            {"node_id": "ghost", "embedding": [0.5, 0.6, 0.7, 0.8]},
+        ]
+        cursor.fetchall.return_value = [("n1",)]
+        with patch.object(eng, "_get_embedding_dimension", return_value=4):
+            with pytest.raises(ValueError, match="Node does not exist: ghost"):
+                eng.store_embeddings(items)
+        cursor.executemany.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -644,7 +670,7 @@ class TestStoreEmbeddingsDimInfer:
         eng.embedding_dimension = None
 
         with patch.object(eng, "_get_embedding_dimension", side_effect=ValueError("no dim")):
-            with patch.object(eng, "_assert_node_exists", return_value=True):
+            with patch.object(eng, "_assert_nodes_exist", return_value=True):
                 result = eng.store_embeddings([
                     {"node_id": "n1", "embedding": [0.1, 0.2, 0.3, 0.4]},
                 ])
@@ -663,7 +689,7 @@ class TestStoreEmbeddingsDimInfer:
         cursor.execute.side_effect = exec_side
 
         with patch.object(eng, "_get_embedding_dimension", return_value=4):
-            with patch.object(eng, "_assert_node_exists", return_value=True):
+            with patch.object(eng, "_assert_nodes_exist", return_value=True):
                 result = eng.store_embeddings([
                     {"node_id": "n1", "embedding": [0.1, 0.2, 0.3, 0.4]},
                 ])
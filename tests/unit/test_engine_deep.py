@@ -14,6 +14,7 @@ def _make_engine(rows=None, fetchone_val=None):
     conn = MagicMock()
     cursor = MagicMock()
     cursor.fetchall.return_value = rows if rows is not None else []
+    cursor.fetchmany.return_value = []
     cursor.fetchone.return_value = fetchone_val if fetchone_val is not None else (0,)
     cursor.description = [("col1",)]
     conn.cursor.return_value = cursor
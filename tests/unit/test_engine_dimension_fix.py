@@ -1,10 +1,11 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from iris_vector_graph.engine import IRISGraphEngine
+from tests.unit._mock_helpers import FastConn
 
 def test_engine_init_with_dimension():
     """Verify that IRISGraphEngine accepts and uses an explicit embedding_dimension."""
-    conn = MagicMock()
+    conn = FastConn()
     engine = IRISGraphEngine(conn, embedding_dimension=128)
     assert engine.embedding_dimension == 128
     assert engine._get_embedding_dimension() == 128
@@ -12,11 +13,10 @@ def test_engine_init_with_dimension():
 @patch("iris_vector_graph.schema.GraphSchema.get_embedding_dimension")
 def test_engine_dimension_auto_detection_failure_inference(mock_get_dim):
     """Verify that IRISGraphEngine infers dimension from input if auto-detection fails."""
-    # Setup mocks to fail auto-detection
+    # Setup mocks to fail auto-detection; FastCursor.fetchone() always returns
+    # None, so the INFORMATION_SCHEMA check fails
     mock_get_dim.return_value = None
-    conn = MagicMock()
-    cursor = conn.cursor.return_value
-    cursor.fetchone.return_value = None  # INFORMATION_SCHEMA check fails
+    conn = FastConn()
     
     engine = IRISGraphEngine(conn)
     
@@ -28,6 +28,7 @@ def test_engine_dimension_auto_detection_failure_inference(mock_get_dim):
         
         assert engine.embedding_dimension == 3
         
+    with patch.object(engine, "_assert_nodes_exist"):
         # Test store_embeddings inference (should already be set now)
         items = [{"node_id": "node:2", "embedding": [0.4, 0.5, 0.6]}]
         engine.store_embeddings(items)
@@ -35,9 +36,23 @@ def test_engine_dimension_auto_detection_failure_inference(mock_get_dim):
 
 def test_engine_dimension_mismatch():
     """Verify that dimension mismatch raises ValueError."""
-    conn = MagicMock()
+    conn = FastConn()
     engine = IRISGraphEngine(conn, embedding_dimension=3)
     
     with patch.object(engine, "_assert_node_exists"):
         with pytest.raises(ValueError, match="Embedding dimension mismatch"):
             engine.store_embedding("node:1", [0.1, 0.2])
+
+def test_store_embedding_accepts_float64_ndarray():
+    """A float64 ndarray is serialized exactly like the equivalent list."""
+    np = pytest.importorskip("numpy")
+    conn = FastConn()
+    engine = IRISGraphEngine(conn, embedding_dimension=3)
+
+    with patch.object(engine, "_assert_node_exists"):
+        engine.store_embedding("node:1", np.array([0.1, 2.0, 3e-9]))
+        engine.store_embedding("node:2", [0.1, 2.0, 3e-9])
+
+    inserts = [sql for sql, _ in conn.cur.executed if sql.startswith("INSERT")]
+    assert "TO_VECTOR('0.1,2.0,3e-09'" in inserts[0]
+    assert inserts[0] == inserts[1]
@@ -72,3 +72,36 @@ def test_store_embeddings_atomic_failure():
                 {"node_id": "node-missing", "embedding": [0.1, 0.2, 0.3]},
             ]
         )
+
+
+def test_embed_query_caches_repeated_queries():
+    engine = IRISGraphEngine(DummyConn())
+    calls = []
+    engine.embedder = lambda text: calls.append(text) or [0.1, 0.2, 0.3]
+
+    first = engine._embed_query("kinase inhibitor")
+    second = engine._embed_query("  kinase inhibitor ")
+
+    assert first == second == [0.1, 0.2, 0.3]
+    assert calls == ["kinase inhibitor"]
+
+
+def test_embed_query_cache_is_bounded():
+    engine = IRISGraphEngine(DummyConn())
+    engine.embedder = lambda text: [float(len(text))]
+    engine._QUERY_EMBEDDING_CACHE_SIZE = 2
+
+    for text in ("a", "bb", "ccc"):
+        engine._embed_query(text)
+
+    assert list(engine._query_embedding_cache) == ["bb", "ccc"]
+
+
+def test_embed_query_cache_cleared_when_embedder_changes():
+    engine = IRISGraphEngine(DummyConn())
+    engine.embedder = lambda text: [1.0]
+    assert engine._embed_query("q") == [1.0]
+
+    engine.embedder = lambda text: [2.0]
+    assert engine._embed_query("q") == [2.0]
+    assert list(engine._query_embedding_cache.values()) == [(2.0,)]
@@ -1,42 +1,33 @@
 import pytest
-import json
-from unittest.mock import MagicMock, patch
 from iris_vector_graph.engine import IRISGraphEngine
+from tests.unit._mock_helpers import FastConn, ScriptedCursor
 
 @pytest.fixture
-def mock_conn():
-    conn = MagicMock()
-    # Mock cursor and its methods
-    cursor = MagicMock()
-    conn.cursor.return_value = cursor
-    return conn
+def fake_conn():
+    return FastConn(cursor_cls=ScriptedCursor)
 
 @pytest.fixture
-def engine(mock_conn):
-    return IRISGraphEngine(mock_conn)
+def engine(fake_conn):
+    engine = IRISGraphEngine(fake_conn)
+    # Drop the constructor's probe statements so tests only see their own SQL
+    fake_conn.cur.executed.clear()
+    return engine
 
-def test_get_nodes_batching(engine, mock_conn):
-    cursor = mock_conn.cursor.return_value
+def test_get_nodes_batching(engine, fake_conn):
+    cursor = fake_conn.cur
     
-    # Setup mock data for fetchall
-    # labels query result
-    labels_rows = [
-        ("node-1", "LabelA"),
-        ("node-1", "LabelB"),
-        ("node-2", "LabelC")
-    ]
-    # properties query result
-    props_rows = [
-        ("node-1", "name", "Node 1"),
-        ("node-1", "meta", '{"key": "val"}'),
-        ("node-2", "name", "Node 2")
-    ]
-    
-    # Configure mock to return different results for sequential calls
-    cursor.fetchall.side_effect = [
-        labels_rows,  # First call for labels
-        props_rows,   # Second call for properties
-        []            # Third call for empty nodes (if any)
+    # Single tagged UNION ALL result: P = property, L = label, N = nodes row
+    cursor.results = [
+        [
+            ("node-1", "P", "name", "Node 1"),
+            ("node-1", "P", "meta", '{"key": "val"}'),
+            ("node-2", "P", "name", "Node 2"),
+            ("node-1", "L", "LabelA", None),
+            ("node-1", "L", "LabelB", None),
+            ("node-2", "L", "LabelC", None),
+            ("node-1", "N", None, None),
+            ("node-2", "N", None, None),
+        ],
     ]
     
     node_ids = ["node-1", "node-2"]
@@ -55,35 +46,25 @@ def test_get_nodes_batching(engine, mock_conn):
     assert node2["labels"] == ["LabelC"]
     assert node2["name"] == "Node 2"
     
-    # Verify exact number of queries (excluding potential empty node check)
-    # Actually, the implementation calls fetchall() for labels, then for properties.
-    assert cursor.execute.call_count >= 2
-    
-    # Verify the SQL used batching (search all calls, not just first — _probe_native_vec runs first)
-    all_queries = [call[0][0] for call in cursor.execute.call_args_list if call[0]]
-    assert any("IN (?,?)" in q for q in all_queries), f"No IN batching found in: {all_queries}"
+    # Labels, properties and existence come back from one round-trip
+    assert len(cursor.executed) == 1
+    sql, params = cursor.executed[0]
+    assert "UNION ALL" in sql
+    assert "IN (?,?)" in sql
+    assert params == node_ids * 3
 
-def test_get_nodes_handles_missing_nodes(engine, mock_conn):
-    cursor = mock_conn.cursor.return_value
-    
-    # Mock labels and props only for node-1
-    cursor.fetchall.side_effect = [
-        [("node-1", "LabelA")], # labels
-        [("node-1", "name", "Node 1")], # props
-        [("node-1",)] # nodes existence check for empty ones (not really needed if node-1 found)
+def test_get_nodes_handles_missing_nodes(engine, fake_conn):
+    # missing-node has no props, labels or nodes row, so it is dropped
+    fake_conn.cur.results = [
+        [
+            ("node-1", "P", "name", "Node 1"),
+            ("node-1", "L", "LabelA", None),
+            ("node-1", "N", None, None),
+        ],
     ]
     
     node_ids = ["node-1", "missing-node"]
     
-    # For missing-node, it will be considered empty.
-    # The code will then check existence in 'nodes' table for 'missing-node'.
-    # We mock it to NOT exist.
-    cursor.fetchall.side_effect = [
-        [("node-1", "LabelA")], # labels
-        [("node-1", "name", "Node 1")], # props
-        [("node-1",)] # nodes existence check result: only node-1 exists
-    ]
-    
     nodes = engine.get_nodes(node_ids)
     
     assert len(nodes) == 1
@@ -91,3 +72,65 @@ def test_get_nodes_handles_missing_nodes(engine, mock_conn):
 
 def test_get_nodes_empty_input(engine):
     assert engine.get_nodes([]) == []
+
+def test_get_nodes_chunks_large_batches(engine, fake_conn):
+    node_ids = [f"node-{i}" for i in range(1200)]
+    engine.get_nodes(node_ids)
+
+    calls = fake_conn.cur.executed
+    assert all(len(params) <= 499 for _, params in calls)
+    assert all(sql.count("?") == len(params) for sql, params in calls)
+    assert [len(params) for _, params in calls] == [3 * 166] * 7 + [3 * 38]
+    assert calls[0][0] == calls[1][0]
+    assert calls[-1][1][:38] == node_ids[1162:]
+
+def test_get_nodes_columnar(engine, fake_conn):
+    fake_conn.cur.results = [
+        [
+            ("node-2", "P", "id", "shadowed"),
+            ("node-1", "P", "tags", '["a", "b"]'),
+            ("node-1", "P", "bad", "{not json}"),
+            ("node-2", "L", "LabelC", None),
+            ("node-1", "N", None, None),
+            ("node-2", "N", None, None),
+        ],
+    ]
+
+    cols = engine.get_nodes_columnar(["node-2", "missing", "node-1"])
+
+    assert cols["id"] == ["node-2", "node-1"]
+    assert cols["labels"] == [["LabelC"], []]
+    assert cols["props"] == [{"id": "shadowed"}, {"tags": ["a", "b"], "bad": "{not json}"}]
+
+def test_get_nodes_remaps_structural_keys(engine, fake_conn):
+    fake_conn.cur.results = [[("node-1", "P", "id", "x"), ("node-1", "N", None, None)]]
+
+    assert engine.get_nodes(["node-1"]) == [{"id": "node-1", "labels": [], "p_id": "x"}]
+
+def test_get_nodes_decodes_values_orjson_rejects(engine, fake_conn):
+    fake_conn.cur.results = [
+        [("node-1", "P", "big", "[NaN, 123456789012345678901234567890]"), ("node-1", "N", None, None)]
+    ]
+
+    value = engine.get_nodes(["node-1"])[0]["big"]
+
+    assert value[0] != value[0]
+    assert value[1] == 123456789012345678901234567890
+
+def test_get_nodes_interns_labels_and_keys(engine, fake_conn):
+    # Build equal strings at runtime so they start out as distinct objects
+    label, key = "".join(["Gene", "Label"]), "".join(["sym", "bol"])
+    fake_conn.cur.results = [
+        [
+            ("node-1", "P", "".join(["sym", "bol"]), "A"),
+            ("node-2", "P", key, "B"),
+            ("node-1", "L", "".join(["Gene", "Label"]), None),
+            ("node-2", "L", label, None),
+        ],
+    ]
+
+    cols = engine.get_nodes_columnar(["node-1", "node-2"])
+
+    assert cols["labels"][0][0] is cols["labels"][1][0]
+    k1, k2 = next(iter(cols["props"][0])), next(iter(cols["props"][1]))
+    assert k1 is k2
@@ -26,6 +26,7 @@ def _make_eng(dim=4):
     cursor.execute.return_value = None
     cursor.executemany.return_value = None
     cursor.fetchall.return_value = []
+    cursor.fetchmany.return_value = []
     cursor.fetchone.return_value = (0,)
     cursor.description = []
     cursor.close.return_value = None
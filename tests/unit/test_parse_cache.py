@@ -31,3 +31,16 @@ def test_different_queries_cached_independently():
         parse_query(q2)
     info = _parse_query_cached.cache_info()
     assert info.currsize == 2
+
+
+def test_cache_keeps_many_distinct_templates():
+    """Apps with a few hundred templated queries should not thrash the cache."""
+    _parse_query_cached.cache_clear()
+    queries = [f"MATCH (n:L{i}) RETURN n" for i in range(300)]
+    for q in queries:
+        parse_query(q)
+    for q in queries:
+        parse_query(q)
+    info = _parse_query_cached.cache_info()
+    assert info.misses == 300
+    assert info.hits == 300
@@ -133,6 +133,51 @@ class TestInitializeSchema:
                             result = eng.initialize_schema(auto_deploy_objectscript=False)
         assert "tables_created" in result
 
+    def test_create_vector_indexes_emits_hnsw_and_repeat_call_hits_iris(self):
+        """create_vector_indexes=True adds the HNSW DDL; a repeat call re-runs the bootstrap."""
+        eng, conn, cursor = self._make_eng_and_cursor()
+
+        sqls = []
+        cursor.execute.side_effect = lambda sql, *a, **kw: sqls.append(sql)
+
+        with patch("iris_vector_graph.schema.GraphSchema.get_base_schema_sql", return_value=""):
+            with patch("iris_vector_graph.schema.GraphSchema.ensure_indexes"):
+                with patch("iris_vector_graph.schema.GraphSchema.get_embedding_dimension", return_value=4):
+                    with patch("iris_vector_graph.schema.GraphSchema.get_procedures_sql_list", return_value=[]):
+                        first = eng.initialize_schema(
+                            auto_deploy_objectscript=False, create_vector_indexes=True
+                        )
+                        n_after_first = len(sqls)
+                        second = eng.initialize_schema(auto_deploy_objectscript=False)
+
+        hnsw = [s for s in sqls if "HNSW" in s]
+        assert hnsw == [
+            "CREATE INDEX HNSW_NodeEmb ON Graph_KG.kg_NodeEmbeddings (emb) "
+            "AS HNSW(M=16, efConstruction=100, Distance='Cosine')"
+        ]
+        assert len(sqls) > n_after_first
+        assert not any("HNSW" in s for s in sqls[n_after_first:])
+        assert second.keys() == first.keys()
+
+    def test_create_vector_indexes_failure_is_reported(self):
+        """A failed HNSW build surfaces in status['warnings'] rather than only the log."""
+        eng, conn, cursor = self._make_eng_and_cursor()
+
+        def _execute(sql, *a, **kw):
+            if "HNSW" in sql:
+                raise Exception("SQLCODE -400 index build failed")
+        cursor.execute.side_effect = _execute
+
+        with patch("iris_vector_graph.schema.GraphSchema.get_base_schema_sql", return_value=""):
+            with patch("iris_vector_graph.schema.GraphSchema.ensure_indexes"):
+                with patch("iris_vector_graph.schema.GraphSchema.get_embedding_dimension", return_value=4):
+                    with patch("iris_vector_graph.schema.GraphSchema.get_procedures_sql_list", return_value=[]):
+                        status = eng.initialize_schema(
+                            auto_deploy_objectscript=False, create_vector_indexes=True
+                        )
+
+        assert any("HNSW_NodeEmb" in w for w in status["warnings"])
+
 
 # ---------------------------------------------------------------------------
 # _sync_nkg: Rust path and InvalidateAdjCache
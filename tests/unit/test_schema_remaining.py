@@ -94,6 +94,7 @@ class TestSchemaQueryMethods:
         eng = _make_eng()
         cursor = MagicMock()
         cursor.fetchone.return_value = None  # no name property
+        cursor.fetchmany.return_value = []
         eng.conn.cursor.return_value = cursor
         try:
             result = eng.get_node_name("my_node")